@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Differential check and micro-benchmark for pdf_parser.py text cleanup.
+
+The normalize-once normalize_text() / clean_page_lines() / join_pages() path is
+compared against a frozen copy of the original multi-pass pipeline (per-page
+normalize, normalize again after header/footer removal, normalize the joined
+document) on:
+- randomized pages built from the characters the cleanup rules care about
+  (spaces, NBSP, tabs, CR/LF, hyphens, form feeds, Unicode whitespace)
+- resume-like synthetic documents with repeated headers and footers
+- any text files given with --corpus (pages separated by form feeds)
+
+Any mismatch is printed and the script exits 1. Throughput of both versions
+is then reported in MB/s (UTF-8 input bytes) as JSON.
+
+CLI:
+    python3 scripts/benchmark_pdf_normalize.py [--random-docs 2000] [--seed 0]
+        [--corpus extracted/*.txt] [--min-seconds 0.5] [--output bench.json]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import platform
+from typing import Callable, List, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import pdf_parser  # noqa: E402
+from pdf_parser import (  # noqa: E402
+    normalize_text, split_lines, find_header_footer_noise, iter_clean_pages, join_pages,
+    HEADER_SAMPLE_PAGES
+)
+
+
+# ============================================================================
+# REFERENCE (original multi-pass pipeline, kept verbatim)
+# ============================================================================
+
+def reference_normalize_text(text: str) -> str:
+    # Standardize newlines
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    # Collapse tabs to spaces
+    text = text.replace('\t', ' ')
+    # Collapse multiple spaces
+    text = re.sub(r"[ \u00A0]{2,}", " ", text)
+    # Fix hyphenated line breaks: inter-\nnational -> international
+    text = re.sub(r"-\s*\n\s*", "", text)
+    # Remove excessive blank lines
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def reference_parse(raw_pages: List[str]) -> Tuple[str, List[str]]:
+    """(rawText, pages) exactly as the three-pass pipeline produced them."""
+    pages_lines = [split_lines(reference_normalize_text(txt)) for txt in raw_pages]
+    noise = find_header_footer_noise(pages_lines[:HEADER_SAMPLE_PAGES])
+    pages = [
+        reference_normalize_text("\n".join(ln for ln in lines if ln.strip() not in noise))
+        for lines in pages_lines
+    ]
+    return reference_normalize_text("\n\n".join(pages)), pages
+
+
+def current_parse(raw_pages: List[str]) -> Tuple[str, List[str]]:
+    pages = list(iter_clean_pages(raw_pages))
+    return join_pages(pages), pages
+
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+# Weighted toward the characters the cleanup rules treat specially
+_ALPHABET = (["a", "b", "x", "1", ".", "•"] * 3 + [" "] * 6 + ["\n"] * 6 + ["-"] * 4 +
+             ["\u00A0", "\t", "\r", "\r\n", "\f", "\v", "\u2028", "\u2003", "\x85", "--", "- \n"])
+_WORDS = ["Python", "engineer", "data-", "driven", "inter-", "national", "C++", "Node.js",
+          "Led", "team", "of", "5", "•", "2019 - 2023", "e-mail:", "Page"]
+
+
+def random_page(rng: random.Random) -> str:
+    pieces = []
+    for _ in range(rng.randint(0, 120)):
+        pieces.append(rng.choice(_WORDS) if rng.random() < 0.3 else rng.choice(_ALPHABET))
+    return "".join(pieces)
+
+
+def random_document(rng: random.Random) -> List[str]:
+    header = rng.choice(["Jane Doe - Resume", "CONFIDENTIAL", "-", ""])
+    pages = []
+    for i in range(rng.randint(1, 20)):
+        page = random_page(rng)
+        if header and rng.random() < 0.7:
+            page = f"{header}\n{page}\nPage -\n"
+        pages.append(page if rng.random() < 0.9 else rng.choice(["", "  \n \t", "-", "x-"]))
+    return pages
+
+
+def resume_document(rng: random.Random, n_pages: int = 3) -> List[str]:
+    """A plausible extracted resume: dense lines, bullets, hyphenation, header/footer."""
+    pages = []
+    for p in range(n_pages):
+        lines = ["Jane Doe  |  jane@example.com  |  (555) 010-0000"]
+        for _ in range(45):
+            words = [rng.choice(_WORDS[:12]) for _ in range(rng.randint(4, 14))]
+            line = " ".join(words)
+            if rng.random() < 0.2:
+                line = "•\t" + line
+            if rng.random() < 0.1:
+                line += "    "
+            lines.append(line)
+            if rng.random() < 0.08:
+                lines.append("")
+        lines.append(f"Page {p + 1}")
+        pages.append("\r\n".join(lines) if p % 2 else "\n".join(lines))
+    return pages
+
+
+def load_corpus(paths: List[str]) -> List[List[str]]:
+    """Text files as documents; form feeds separate pages."""
+    docs = []
+    for path in paths:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            docs.append(f.read().split('\f'))
+    return docs
+
+
+# ============================================================================
+# CHECKS
+# ============================================================================
+
+def differential_check(docs: List[List[str]]) -> List[str]:
+    """Return human-readable mismatches between the reference and current pipelines."""
+    failures = []
+    for i, raw_pages in enumerate(docs):
+        for j, txt in enumerate(raw_pages):
+            expected, got = reference_normalize_text(txt), normalize_text(txt)
+            if expected != got:
+                failures.append(f"doc {i} page {j} normalize_text: {txt!r} -> {got!r}, expected {expected!r}")
+        expected_doc, got_doc = reference_parse(raw_pages), current_parse(raw_pages)
+        if expected_doc != got_doc:
+            failures.append(f"doc {i} pipeline: {raw_pages!r} -> {got_doc!r}, expected {expected_doc!r}")
+    return failures
+
+
+def throughput(fn: Callable[[List[str]], object], docs: List[List[str]], n_bytes: int,
+               min_seconds: float) -> float:
+    """Best-of-runs MB/s for fn applied to every document."""
+    best = float('inf')
+    deadline = time.perf_counter() + min_seconds
+    runs = 0
+    while runs < 3 or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        for raw_pages in docs:
+            fn(raw_pages)
+        best = min(best, time.perf_counter() - start)
+        runs += 1
+    return round(n_bytes / best / 1e6, 2)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check and benchmark pdf_parser.py text normalization")
+    parser.add_argument("--random-docs", type=int, default=2000, help="Randomized documents to diff")
+    parser.add_argument("--resume-docs", type=int, default=200, help="Resume-like documents to diff and time")
+    parser.add_argument("--corpus", nargs="*", default=[], help="Extra text files (pages split on form feeds)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Minimum timing window per measurement")
+    parser.add_argument("--output", help="Write JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    random_docs = [random_document(rng) for _ in range(args.random_docs)]
+    bench_docs = [resume_document(rng, rng.randint(1, 4)) for _ in range(args.resume_docs)]
+    try:
+        bench_docs += load_corpus(args.corpus)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    failures = differential_check(random_docs + bench_docs)
+    if failures:
+        for line in failures[:20]:
+            print(line, file=sys.stderr)
+        print(f"Error: {len(failures)} mismatches against the reference normalizer", file=sys.stderr)
+        sys.exit(1)
+
+    pages = [[txt] for raw_pages in bench_docs for txt in raw_pages]
+    n_bytes = sum(len(txt.encode('utf-8')) for raw_pages in bench_docs for txt in raw_pages)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parserVersion": pdf_parser.PARSER_VERSION,
+        "documentsChecked": len(random_docs) + len(bench_docs),
+        "mismatches": 0,
+        "benchBytes": n_bytes,
+        "normalizeMBps": {
+            "reference": throughput(lambda d: reference_normalize_text(d[0]), pages, n_bytes, args.min_seconds),
+            "current": throughput(lambda d: normalize_text(d[0]), pages, n_bytes, args.min_seconds)
+        },
+        "pipelineMBps": {
+            "reference": throughput(reference_parse, bench_docs, n_bytes, args.min_seconds),
+            "current": throughput(current_parse, bench_docs, n_bytes, args.min_seconds)
+        }
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
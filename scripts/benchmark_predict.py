@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for scripts/predict.py.
+
+Measures, on synthetic 90-feature inputs:
+- cold: a fresh `python3 scripts/predict.py '<json>'` process per call
+- warm: predict() on one row in a process that already loaded the model
+- batch: predict_batch() throughput at batch sizes 1..4096
+
+Reports p50/p95/p99 latencies, throughput and peak RSS as JSON so runs can
+be diffed before and after model or dependency changes.
+
+CLI:
+    python3 scripts/benchmark_predict.py [--backend keras|numpy] [--cold-runs 5]
+        [--warm-iterations 500] [--batch-sizes 1,8,64,512,4096] [--output bench.json]
+
+Run from the repository root (model paths are relative to it).
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+from typing import Dict, List
+
+import numpy as np
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import predict  # noqa: E402
+from stage_metrics import peak_rss_kb  # noqa: E402
+
+DEFAULT_BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+
+
+def synthetic_features(n: int, seed: int = 0) -> np.ndarray:
+    """N x 90 float32 inputs shaped like real feature vectors (ratios, flags, small counts)."""
+    rng = np.random.default_rng(seed)
+    x = rng.random((n, 90), dtype=np.float32)
+    # A few count-like columns
+    x[:, :10] = np.floor(x[:, :10] * 12)
+    return x
+
+
+def summarize(samples_s: List[float]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds."""
+    ms = np.asarray(samples_s, dtype=np.float64) * 1000.0
+    return {
+        "n": int(ms.size),
+        "meanMs": round(float(ms.mean()), 4),
+        "p50Ms": round(float(np.percentile(ms, 50)), 4),
+        "p95Ms": round(float(np.percentile(ms, 95)), 4),
+        "p99Ms": round(float(np.percentile(ms, 99)), 4),
+        "maxMs": round(float(ms.max()), 4)
+    }
+
+
+def bench_cold(backend: str, runs: int, seed: int) -> dict:
+    """Spawn one predict.py process per call; report wall latency and child peak RSS."""
+    features = synthetic_features(1, seed)[0].tolist()
+    payload = json.dumps({"features": features})
+    cmd = [sys.executable, os.path.join(SCRIPTS_DIR, 'predict.py'), '--backend', backend, payload]
+    samples = []
+    peaks = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        proc.stdout.read()
+        _, status, usage = os.wait4(proc.pid, 0)
+        samples.append(time.perf_counter() - start)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if proc.returncode != 0:
+            raise RuntimeError(f"predict.py exited with {proc.returncode}")
+        peak = usage.ru_maxrss
+        peaks.append(peak // 1024 if sys.platform == 'darwin' else peak)
+    result = summarize(samples)
+    result["peakRssKb"] = max(peaks)
+    return result
+
+
+def bench_warm(iterations: int, seed: int) -> dict:
+    """predict() on single rows with the model already loaded."""
+    rows = synthetic_features(min(iterations, 1024), seed).tolist()
+    predict.predict(rows[0])  # warm-up (and model load)
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        predict.predict(rows[i % len(rows)])
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_batches(batch_sizes: List[int], seed: int, min_seconds: float = 0.5) -> List[dict]:
+    """predict_batch() latency and rows/s at each batch size."""
+    results = []
+    x = synthetic_features(max(batch_sizes), seed)
+    for size in batch_sizes:
+        batch = x[:size]
+        predict.predict_batch(batch)  # warm-up for this shape
+        samples = []
+        deadline = time.perf_counter() + min_seconds
+        while len(samples) < 5 or time.perf_counter() < deadline:
+            start = time.perf_counter()
+            predict.predict_batch(batch)
+            samples.append(time.perf_counter() - start)
+        entry = summarize(samples)
+        entry["batchSize"] = size
+        entry["rowsPerSec"] = round(size / float(np.median(samples)), 1)
+        results.append(entry)
+    return results
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the predict.py inference path")
+    parser.add_argument("--backend", choices=predict.BACKENDS, default='keras')
+    parser.add_argument("--cold-runs", type=int, default=5, help="Fresh processes to time (0 skips)")
+    parser.add_argument("--warm-iterations", type=int, default=500, help="Single-row calls to time (0 skips)")
+    parser.add_argument("--batch-sizes", default=",".join(str(b) for b in DEFAULT_BATCH_SIZES),
+                        help="Comma-separated batch sizes ('' skips)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b.strip()]
+    report = {
+        "backend": args.backend,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    }
+
+    if args.cold_runs > 0:
+        report["cold"] = bench_cold(args.backend, args.cold_runs, args.seed)
+
+    predict.set_backend(args.backend)
+    if args.warm_iterations > 0 or batch_sizes:
+        load_start = time.perf_counter()
+        predict.get_model()
+        report["modelLoadMs"] = round((time.perf_counter() - load_start) * 1000.0, 3)
+    if args.warm_iterations > 0:
+        report["warm"] = bench_warm(args.warm_iterations, args.seed)
+    if batch_sizes:
+        report["batch"] = bench_batches(batch_sizes, args.seed)
+    report["peakRssKb"] = peak_rss_kb()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for company_scraper.py over a recorded corpus.
+
+Replays a corpus recorded with `scrape_replay.py record` and measures:
+- end-to-end: scrape_company() against a local ReplayServer, for each
+  --workers value, with optional injected latency and errors (jobs/s, wall
+  time, server request/error counts)
+- parsing: parse_job_list() / parse_job_page() time per recorded page
+- extraction: extract_skills() / extract_years() over the parsed job
+  descriptions (calls/s and MB/s)
+
+Nothing touches the network, so runs are repeatable and can be diffed
+before and after concurrency or parsing changes.
+
+CLI:
+    python3 scripts/benchmark_scraper.py --corpus corpus/ [--company Google]
+        [--workers 1,4,8,16] [--per-host 4] [--latency-ms 50] [--jitter-ms 25]
+        [--error-rate 0.0] [--drop-rate 0.0] [--seed 0] [--min-seconds 0.5] [--output bench.json]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import platform
+from typing import Callable, Dict, List, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import company_scraper  # noqa: E402
+from company_scraper import parse_job_list, parse_job_page, extract_skills, extract_years  # noqa: E402
+from scrape_replay import Corpus, ReplayServer  # noqa: E402
+
+DEFAULT_WORKERS = [1, 4, 8, 16]
+# Walk every recorded listing page
+MAX_LISTING_PAGES = 1000
+
+
+def recorded_pages(corpus: Corpus, config: Dict) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Walk the recorded listing pages offline from careersUrl.
+
+    Returns:
+        (listing page HTML, [(job URL, job page HTML)]) for pages in the corpus
+    """
+    listing, jobs, seen = [], [], set()
+    url = config["careersUrl"]
+    while url and len(listing) < MAX_LISTING_PAGES:
+        body = corpus.body(url)
+        if body is None:
+            break
+        html = body.decode('utf-8', errors='replace')
+        listing.append(html)
+        job_urls, url = parse_job_list(html, config)
+        for job_url in job_urls:
+            job_body = corpus.body(job_url)
+            if job_body is not None and job_url not in seen:
+                seen.add(job_url)
+                jobs.append((job_url, job_body.decode('utf-8', errors='replace')))
+    return listing, jobs
+
+
+def best_seconds(fn: Callable[[], object], min_seconds: float) -> float:
+    """Best-of-runs wall time of fn()."""
+    best = float('inf')
+    deadline = time.perf_counter() + min_seconds
+    runs = 0
+    while runs < 3 or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+        runs += 1
+    return best
+
+
+def bench_parsing(config: Dict, listing: List[str], job_pages: List[Tuple[str, str]],
+                  min_seconds: float) -> Dict:
+    def per_page_ms(fn: Callable[[], object], n: int) -> float:
+        return round(best_seconds(fn, min_seconds) / n * 1000.0, 4) if n else 0.0
+
+    return {
+        "listingPages": len(listing),
+        "jobPages": len(job_pages),
+        "parseJobListMsPerPage": per_page_ms(lambda: [parse_job_list(h, config) for h in listing], len(listing)),
+        "parseJobPageMsPerPage": per_page_ms(lambda: [parse_job_page(h, config, u) for u, h in job_pages],
+                                             len(job_pages))
+    }
+
+
+def bench_extraction(descriptions: List[str], min_seconds: float) -> Dict:
+    n_bytes = sum(len(d.encode('utf-8')) for d in descriptions)
+    report = {"descriptions": len(descriptions), "bytes": n_bytes}
+    for name, fn in (("extractSkills", extract_skills), ("extractYears", extract_years)):
+        if not descriptions:
+            report[name] = {"callsPerSecond": 0.0, "MBps": 0.0}
+            continue
+        seconds = best_seconds(lambda: [fn(d) for d in descriptions], min_seconds)
+        report[name] = {"callsPerSecond": round(len(descriptions) / seconds, 1),
+                        "MBps": round(n_bytes / seconds / 1e6, 2)}
+    return report
+
+
+def bench_end_to_end(corpus: Corpus, config: Dict, workers: int, args) -> Dict:
+    server = ReplayServer(corpus, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          error_rate=args.error_rate, drop_rate=args.drop_rate, seed=args.seed)
+    with server:
+        company_scraper.set_replay_base(server.base_url)
+        try:
+            start = time.perf_counter()
+            jobs = company_scraper.scrape_company(config, max_pages=MAX_LISTING_PAGES, workers=workers,
+                                                  per_host=args.per_host, page_delay=args.page_delay)
+            seconds = time.perf_counter() - start
+        finally:
+            company_scraper.set_replay_base(None)
+    return {
+        "workers": workers,
+        "jobs": len(jobs),
+        "seconds": round(seconds, 3),
+        "jobsPerSecond": round(len(jobs) / seconds, 1) if seconds > 0 else 0.0,
+        "server": server.stats()
+    }
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark company_scraper.py against a recorded corpus")
+    parser.add_argument("--corpus", required=True, help="Corpus recorded with scrape_replay.py record")
+    parser.add_argument("--company", help="Only benchmark this recorded company")
+    parser.add_argument("--workers", default=",".join(map(str, DEFAULT_WORKERS)),
+                        help="Comma-separated scrape worker counts to time end to end")
+    parser.add_argument("--per-host", type=int, default=company_scraper.DEFAULT_PER_HOST)
+    parser.add_argument("--page-delay", type=float, default=0.0,
+                        help="Pause between listing pages (the live default is "
+                             f"{company_scraper.LISTING_PAGE_DELAY}s)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected delay per response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Injected extra random delay per response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of connections dropped")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Minimum timing window per measurement")
+    parser.add_argument("--output", help="Write JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    corpus = Corpus(args.corpus)
+    configs = corpus.configs
+    if args.company:
+        configs = [c for c in configs if c.get("name", "").lower() == args.company.lower()]
+    if not corpus.pages or not configs:
+        print(f"Error: no recorded pages/configs in {args.corpus}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        worker_counts = [int(w) for w in args.workers.split(",") if w.strip()]
+    except ValueError:
+        print(f"Error: bad --workers {args.workers!r}", file=sys.stderr)
+        sys.exit(1)
+
+    # Per-page scraper logging would dominate the timings
+    logging.getLogger(company_scraper.__name__).setLevel(logging.WARNING)
+
+    companies = []
+    for config in configs:
+        listing, job_pages = recorded_pages(corpus, config)
+        descriptions = [parse_job_page(h, config, u)["description"] for u, h in job_pages]
+        companies.append({
+            "company": config.get("name"),
+            "parsing": bench_parsing(config, listing, job_pages, args.min_seconds),
+            "extraction": bench_extraction(descriptions, args.min_seconds),
+            "endToEnd": [bench_end_to_end(corpus, config, w, args) for w in worker_counts]
+        })
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parseVersion": company_scraper.PARSE_VERSION,
+        "corpusPages": len(corpus.pages),
+        "injected": {"latencyMs": args.latency_ms, "jitterMs": args.jitter_ms,
+                     "errorRate": args.error_rate, "dropRate": args.drop_rate},
+        "companies": companies
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
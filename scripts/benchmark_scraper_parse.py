@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Differential check and throughput benchmark for company_scraper.py page parsing.
+
+parse_job_list() / parse_job_page() are compared against a frozen copy of the
+original BeautifulSoup("html.parser") implementation on:
+- synthetic listing and job pages shaped like career sites (nav, scripts,
+  styles, comments and templates inside descriptions, long descriptions)
+- saved pages given with --pages (files or directories of *.html)
+- page bodies stored by --http-cache-dir (see http_cache.py)
+
+Titles, descriptions, locations and listing URLs must match; skills are
+left out of the comparison because they are now taken from the description
+text instead of its serialized HTML. Mismatches are printed and the script
+exits 1. Pages per second for both versions are then reported as JSON.
+
+CLI:
+    python3 scripts/benchmark_scraper_parse.py [--company Google | --config c.json]
+        [--pages saved/ job.html ...] [--http-cache-dir .http-cache]
+        [--synthetic 200] [--seed 0] [--min-seconds 0.5] [--output bench.json]
+
+Run from the repository root (--company reads lib/scrapers/companies.json).
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import platform
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import fast_html  # noqa: E402
+import company_scraper  # noqa: E402
+from company_scraper import parse_job_list, parse_job_page, extract_skills, extract_years  # noqa: E402
+
+DEFAULT_CONFIG = {
+    "name": "Synthetic",
+    "careersUrl": "https://careers.example.com/jobs/",
+    "jobLinkSelector": "a[href*='/jobs/results/'], a.gs-title-link",
+    "titleSelector": "h1, .gc-job-details__title",
+    "descriptionSelector": ".gc-job-details__description, .job-description",
+    "locationSelector": ".gc-job-info__location, .location",
+    "nextPageSelector": "a[rel='next']"
+}
+
+
+# ============================================================================
+# REFERENCE (original BeautifulSoup implementation, kept verbatim)
+# ============================================================================
+
+def reference_parse_job_list(html: str, config: Dict) -> Tuple[List[str], Optional[str]]:
+    soup = BeautifulSoup(html, "html.parser")
+    job_urls = []
+    for link in soup.select(config["jobLinkSelector"]):
+        href = link.get("href")
+        if href:
+            job_urls.append(urljoin(config["careersUrl"], href.strip()))
+    job_urls = list(dict.fromkeys(job_urls))
+    next_page = None
+    if config.get("nextPageSelector"):
+        next_elem = soup.select_one(config["nextPageSelector"])
+        if next_elem:
+            next_href = next_elem.get("href") or next_elem.get("data-href")
+            if next_href:
+                next_page = urljoin(config["careersUrl"], next_href.strip())
+    return job_urls, next_page
+
+
+def reference_parse_job_page(html: str, config: Dict, job_url: str) -> Dict:
+    soup = BeautifulSoup(html, "html.parser")
+    title = ""
+    title_elem = soup.select_one(config.get("titleSelector", "h1"))
+    if title_elem:
+        title = title_elem.get_text(strip=True)
+    desc_elem = soup.select_one(config.get("descriptionSelector", ".job-description"))
+    if desc_elem:
+        description = desc_elem.get_text(separator="\n", strip=True)
+        desc_html = str(desc_elem)
+    else:
+        description = soup.get_text(separator="\n", strip=True)
+        desc_html = description
+    location = None
+    if config.get("locationSelector"):
+        loc_elem = soup.select_one(config["locationSelector"])
+        if loc_elem:
+            location = loc_elem.get_text(strip=True)
+    return {
+        "title": title or "",
+        "requiredSkills": extract_skills(desc_html),
+        "yearsRequired": extract_years(description),
+        "location": location,
+        "description": description or "",
+        "url": job_url
+    }
+
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+_WORDS = ["We", "are", "hiring", "engineers", "who", "love", "React", "TypeScript", "Python",
+          "Kubernetes", "AWS", "PostgreSQL", "and", "distributed", "systems", "5+ years",
+          "Node.js", "C++", "to", "build", "scalable", "services", "&amp;", "teams"]
+_PAGE_HEAD = (
+    "<!DOCTYPE html><html><head><title>Careers</title>"
+    "<style>.job-description{color:#333}</style>"
+    "<script>window.__DATA__ = {\"react\": true};</script></head><body>"
+    "<nav>" + "".join(f"<a href='/about/{i}'>About {i}</a>" for i in range(40)) + "</nav>"
+)
+_PAGE_TAIL = (
+    "<footer>" + "".join(f"<p>Footer link <a href='/legal/{i}'>{i}</a></p>" for i in range(30)) +
+    "</footer><script>trackPageView();</script></body></html>"
+)
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 18))) + "."
+
+
+def synthetic_job_page(rng: random.Random) -> str:
+    parts = [_PAGE_HEAD, "<main><div class='gc-job-details'>"]
+    if rng.random() < 0.9:
+        parts.append(f"<h1 class='gc-job-details__title'> Senior Engineer {rng.randint(1, 999)} </h1>")
+    parts.append("<div class='gc-job-info__location'><span>Mountain View,</span> <span>CA</span></div>")
+    if rng.random() < 0.9:
+        parts.append("<div class='gc-job-details__description'>")
+        for _ in range(rng.randint(3, 12)):
+            parts.append(f"<h3>{rng.choice(_WORDS)}</h3><p>{_sentence(rng)} <b>{rng.choice(_WORDS)}</b></p>")
+            parts.append("<ul>" + "".join(f"<li>{_sentence(rng)}</li>" for _ in range(rng.randint(2, 6))) + "</ul>")
+            if rng.random() < 0.2:
+                parts.append("<!-- tracking: python --><script>var x = 'golang';</script>")
+            if rng.random() < 0.2:
+                parts.append("<template><p>kubernetes <b>rust</b></template>tail text"
+                             "<style>.x{}</style><script><p>terraform</p></script>")
+        parts.append("</div>")
+    else:
+        parts.append(f"<section><p>{_sentence(rng)}</p></section>")
+    parts.append("</div></main>")
+    parts.append(_PAGE_TAIL)
+    return "".join(parts)
+
+
+def synthetic_listing_page(rng: random.Random, page: int) -> str:
+    parts = [_PAGE_HEAD, "<main><ul class='results'>"]
+    for i in range(rng.randint(10, 40)):
+        job_id = rng.randint(1, 5000)
+        parts.append(f"<li><a class='gs-title-link' href=' /jobs/results/{job_id}-engineer '>"
+                     f"Engineer {job_id}</a><span class='location'>Remote</span></li>")
+    parts.append("</ul>")
+    if rng.random() < 0.8:
+        parts.append(f"<a rel='next' href='?page={page + 1}'>Next</a>")
+    parts.append("</main>")
+    parts.append(_PAGE_TAIL)
+    return "".join(parts)
+
+
+def load_pages(paths: List[str]) -> List[str]:
+    """HTML files, and *.html / *.htm files found under directories."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, names in os.walk(path):
+                files += [os.path.join(dirpath, n) for n in sorted(names) if n.endswith((".html", ".htm"))]
+        else:
+            files.append(path)
+    pages = []
+    for path in files:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            pages.append(f.read())
+    return pages
+
+
+def load_http_cache(cache_dir: str) -> List[str]:
+    """Page bodies stored by http_cache.HttpCache."""
+    pages = []
+    for dirpath, _, names in os.walk(cache_dir):
+        for name in sorted(names):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(dirpath, name), encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get("body"), str):
+                pages.append(entry["body"])
+    return pages
+
+
+# ============================================================================
+# CHECKS
+# ============================================================================
+
+_COMPARED_FIELDS = ("title", "description", "location", "url")
+
+
+def differential_check(job_pages: List[str], listing_pages: List[str], config: Dict) -> List[str]:
+    """Return human-readable mismatches between the reference and current parsers."""
+    failures = []
+    for i, html in enumerate(job_pages):
+        expected = reference_parse_job_page(html, config, "https://example.com/job")
+        got = parse_job_page(html, config, "https://example.com/job")
+        for field in _COMPARED_FIELDS:
+            if expected[field] != got[field]:
+                failures.append(f"job page {i} {field}: {got[field]!r}, expected {expected[field]!r}")
+    for i, html in enumerate(listing_pages):
+        expected, got = reference_parse_job_list(html, config), parse_job_list(html, config)
+        if expected != got:
+            failures.append(f"listing page {i}: {got!r}, expected {expected!r}")
+    return failures
+
+
+def pages_per_second(fn: Callable[[str], object], pages: List[str], min_seconds: float) -> float:
+    """Best-of-runs pages/s for fn applied to every page."""
+    if not pages:
+        return 0.0
+    best = float('inf')
+    deadline = time.perf_counter() + min_seconds
+    runs = 0
+    while runs < 3 or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        for html in pages:
+            fn(html)
+        best = min(best, time.perf_counter() - start)
+        runs += 1
+    return round(len(pages) / best, 1)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check and benchmark company_scraper.py page parsing")
+    parser.add_argument("--company", help="Use this company's selectors from lib/scrapers/companies.json")
+    parser.add_argument("--config", help="Use the selectors in this company config JSON")
+    parser.add_argument("--pages", nargs="*", default=[], help="Saved job pages (files or directories)")
+    parser.add_argument("--listing-pages", nargs="*", default=[], help="Saved listing pages (files or directories)")
+    parser.add_argument("--http-cache-dir", help="Also use page bodies stored in this HTTP cache")
+    parser.add_argument("--synthetic", type=int, default=200, help="Synthetic job pages (and listing pages / 4)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Minimum timing window per measurement")
+    parser.add_argument("--output", help="Write JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    config = DEFAULT_CONFIG
+    try:
+        if args.config:
+            with open(args.config) as f:
+                config = json.load(f)
+        elif args.company:
+            with open("lib/scrapers/companies.json") as f:
+                matches = [c for c in json.load(f) if c.get("name", "").lower() == args.company.lower()]
+            if not matches:
+                print(f"Error: unknown company {args.company}", file=sys.stderr)
+                sys.exit(1)
+            config = matches[0]
+        rng = random.Random(args.seed)
+        job_pages = [synthetic_job_page(rng) for _ in range(args.synthetic)]
+        listing_pages = [synthetic_listing_page(rng, i) for i in range(max(1, args.synthetic // 4))]
+        job_pages += load_pages(args.pages)
+        listing_pages += load_pages(args.listing_pages)
+        if args.http_cache_dir:
+            job_pages += load_http_cache(args.http_cache_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    failures = differential_check(job_pages, listing_pages, config)
+    if failures:
+        for line in failures[:20]:
+            print(line, file=sys.stderr)
+        print(f"Error: {len(failures)} mismatches against the reference parser", file=sys.stderr)
+        sys.exit(1)
+
+    selectors = [config.get(k) for k in ("titleSelector", "descriptionSelector", "locationSelector")]
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parseVersion": company_scraper.PARSE_VERSION,
+        "lxml": fast_html.HAVE_LXML,
+        "fastPathSelectors": fast_html.supports(*selectors),
+        "jobPages": len(job_pages),
+        "listingPages": len(listing_pages),
+        "mismatches": 0,
+        "jobPagesPerSecond": {
+            "reference": pages_per_second(lambda h: reference_parse_job_page(h, config, ""), job_pages,
+                                          args.min_seconds),
+            "current": pages_per_second(lambda h: parse_job_page(h, config, ""), job_pages, args.min_seconds)
+        },
+        "listingPagesPerSecond": {
+            "reference": pages_per_second(lambda h: reference_parse_job_list(h, config), listing_pages,
+                                          args.min_seconds),
+            "current": pages_per_second(lambda h: parse_job_list(h, config), listing_pages, args.min_seconds)
+        }
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -19,23 +19,76 @@ Output format per job:
 Usage:
   python3 scripts/company_scraper.py --company Google --max-pages 2
   python3 scripts/company_scraper.py --config config.json --max-pages 1
+  python3 scripts/company_scraper.py --company Google --workers 16 --per-host 4
+
+Job pages are downloaded and parsed by a thread pool (--workers caps all
+requests in flight, --per-host caps them per host) while listing pages are
+still being walked. Jobs are returned in listing order regardless of which
+download finishes first.
+
+Streaming output (see job_stream.py):
+  python3 scripts/company_scraper.py --company Google --ndjson --output jobs.ndjson [--resume]
+writes each job as one NDJSON line the moment it is parsed (completion
+order), so consumers can start before the crawl ends. --resume keeps the
+jobs an interrupted run already wrote and only fetches the rest.
+
+--dedupe collapses postings whose descriptions are near-duplicates (the same
+role cross-posted under several URLs) into one job with an "aliases" list
+(see near_duplicates.py, which also runs standalone over NDJSON output).
+
+For offline runs, scrape_replay.py records the pages a scrape fetches and
+serves them back from localhost; benchmark_scraper.py times a replayed crawl.
+
+All requests share one keep-alive session and retry transient failures
+(connection errors, 429, 5xx) with exponential backoff. With
+--http-cache-dir (or $SCRAPER_HTTP_CACHE_DIR), pages are revalidated with
+If-None-Match / If-Modified-Since; a 304 reuses the stored page and the job
+parsed from it (see http_cache.py).
+
+Incremental crawls (see crawl_state.py):
+  python3 scripts/company_scraper.py --company Google --state-dir .crawl-state --report changes.json
+keep each company's known postings between runs. Listing pages are always
+walked, but a known posting is only re-fetched once it is --recheck-hours
+old, and is only re-parsed if its page body changed. The report lists the
+URLs added, updated and removed since the last run; removals are only
+inferred when the whole listing was walked.
+
+With lxml installed, pages are parsed by libxml2 and the configured selectors
+are evaluated as XPath (see fast_html.py); only the selected elements are
+turned into text. Selectors it can't translate fall back to BeautifulSoup.
 """
 
+import os
 import re
 import json
 import time
+import random
+import hashlib
 import logging
-from typing import List, Dict, Optional, Tuple
-from urllib.parse import urljoin
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib.parse import quote, urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+from http_cache import HttpCache
+from crawl_state import CompanyCrawlState, content_hash, state_path
+from keyword_matcher import KeywordMatcher
+from job_stream import JobStreamWriter
+from near_duplicates import collapse_duplicates
+import fast_html
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 USER_AGENT = "HireableScraper/1.0 (+https://github.com/hireable)"
 
+# BeautifulSoup tree builder for selectors the fast path can't translate
+SOUP_BUILDER = "lxml" if fast_html.HAVE_LXML else "html.parser"
+
 # ============================================================================
 # TECH SKILLS VOCABULARY
 # ============================================================================
@@ -71,32 +124,157 @@ SKILL_NORMALIZE = {
     "kubernetes": "Kubernetes"
 }
 
+# Compiled from TECH_KEYWORDS on first use
+_matcher = None
+
+
+def _skill_matcher() -> KeywordMatcher:
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher(TECH_KEYWORDS)
+    return _matcher
+
 # ============================================================================
 # CORE SCRAPING FUNCTIONS
 # ============================================================================
 
-def fetch_page(url: str, timeout: int = 15, retries: int = 2) -> Optional[str]:
-    """Fetch a web page with retry logic."""
-    headers = {"User-Agent": USER_AGENT}
+# Connections kept alive per host; should be >= the scrape --workers count
+HTTP_POOL_SIZE = 32
+# Statuses worth retrying; other 4xx responses fail immediately
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5
+MAX_BACKOFF = 30.0
+
+_session = None
+_session_lock = threading.Lock()
+
+# Set through scrape_replay.py: a recorder of fetched pages, or a replay server
+# that every request is redirected to (the original URL goes in the path)
+_recorder = None
+_replay_base: Optional[str] = None
+
+
+def set_recorder(recorder) -> None:
+    """Hand every 200 response to recorder.record(url, resp); None stops recording."""
+    global _recorder
+    _recorder = recorder
+
+
+def set_replay_base(base_url: Optional[str]) -> None:
+    """Send requests to a scrape_replay.py server instead of the network; None restores it."""
+    global _replay_base
+    _replay_base = base_url.rstrip("/") if base_url else None
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session; connections are pooled per host across threads."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE,
+                                                    pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _session = session
+    return _session
+
+
+def _backoff_delay(attempt: int, resp: Optional[requests.Response] = None) -> float:
+    """Exponential backoff with jitter, or the server's Retry-After when it gives one."""
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+    return min(MAX_BACKOFF, BACKOFF_BASE * (2 ** attempt)) + random.uniform(0, BACKOFF_BASE)
+
+
+def http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 15,
+             retries: int = 2) -> Optional[requests.Response]:
+    """GET through the shared session, retrying transient failures. Returns a 2xx/304 response or None."""
     for attempt in range(retries + 1):
+        resp = None
         try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
-            resp.raise_for_status()
-            return resp.text
-        except Exception as e:
+            request_url = f"{_replay_base}/{quote(url, safe='')}" if _replay_base else url
+            resp = get_session().get(request_url, headers=headers, timeout=timeout)
+            if resp.ok:
+                if _recorder is not None and resp.status_code == 200:
+                    _recorder.record(url, resp)
+                return resp
+            if resp.status_code not in RETRY_STATUSES:
+                logger.debug(f"Fetch failed with HTTP {resp.status_code}: {url}")
+                break
+            logger.debug(f"Fetch attempt {attempt + 1} got HTTP {resp.status_code}")
+        except requests.RequestException as e:
             logger.debug(f"Fetch attempt {attempt + 1} failed: {e}")
-            if attempt < retries:
-                time.sleep(1 + attempt)
+        if attempt < retries:
+            time.sleep(_backoff_delay(attempt, resp))
     logger.warning(f"Failed to fetch {url}")
     return None
 
 
+def fetch_page(url: str, timeout: int = 15, retries: int = 2) -> Optional[str]:
+    """Fetch a web page with retry logic."""
+    resp = http_get(url, timeout=timeout, retries=retries)
+    return resp.text if resp is not None else None
+
+
+def fetch_cached(url: str, cache: Optional[HttpCache], timeout: int = 15,
+                 retries: int = 2) -> Tuple[Optional[str], Optional[Dict], bool]:
+    """
+    Fetch a page, revalidating any stored copy with a conditional GET.
+
+    Returns:
+        (html, cache entry or None, True if the server answered 304)
+    """
+    if cache is None:
+        return fetch_page(url, timeout, retries), None, False
+
+    entry = cache.get(url)
+    resp = http_get(url, headers=HttpCache.conditional_headers(entry), timeout=timeout, retries=retries)
+    if resp is None:
+        return None, None, False
+    if resp.status_code == 304:
+        if entry is None:
+            return None, None, False
+        cache.count("not_modified")
+        return entry["body"], entry, True
+
+    cache.count("downloaded")
+    html = resp.text
+    etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return html, None, False
+    entry = {"etag": etag, "lastModified": last_modified, "body": html}
+    cache.put(url, entry)
+    return html, entry, False
+
+
+def _parse_scoped(html: str, *selectors: Optional[str]):
+    """lxml tree for the fast path, or None if BeautifulSoup has to evaluate these selectors."""
+    return fast_html.parse(html) if fast_html.supports(*selectors) else None
+
+
+def _soup_text(elem, separator: str = "") -> str:
+    return elem.get_text(separator=separator, strip=True)
+
+
 def parse_job_list(html: str, config: Dict) -> Tuple[List[str], Optional[str]]:
     """Extract job URLs and next page URL from a listing page."""
-    soup = BeautifulSoup(html, "html.parser")
+    link_selector = config["jobLinkSelector"]
+    next_selector = config.get("nextPageSelector")
+
+    root = _parse_scoped(html, link_selector, next_selector)
+    if root is not None:
+        job_links = fast_html.select(root, link_selector)
+        next_elem = fast_html.select_one(root, next_selector) if next_selector else None
+    else:
+        soup = BeautifulSoup(html, SOUP_BUILDER)
+        job_links = soup.select(link_selector)
+        next_elem = soup.select_one(next_selector) if next_selector else None
     
     # Get job links
-    job_links = soup.select(config["jobLinkSelector"])
     job_urls = []
     for link in job_links:
         href = link.get("href")
@@ -109,45 +287,47 @@ def parse_job_list(html: str, config: Dict) -> Tuple[List[str], Optional[str]]:
     
     # Get next page
     next_page = None
-    if config.get("nextPageSelector"):
-        next_elem = soup.select_one(config["nextPageSelector"])
-        if next_elem:
-            next_href = next_elem.get("href") or next_elem.get("data-href")
-            if next_href:
-                next_page = urljoin(config["careersUrl"], next_href.strip())
+    if next_elem is not None:
+        next_href = next_elem.get("href") or next_elem.get("data-href")
+        if next_href:
+            next_page = urljoin(config["careersUrl"], next_href.strip())
     
     return job_urls, next_page
 
 
 def parse_job_page(html: str, config: Dict, job_url: str) -> Dict:
     """Parse individual job page and extract required fields."""
-    soup = BeautifulSoup(html, "html.parser")
+    title_selector = config.get("titleSelector", "h1")
+    desc_selector = config.get("descriptionSelector", ".job-description")
+    loc_selector = config.get("locationSelector")
+
+    # Only the selected elements are turned into text; the rest of the tree stays in C
+    root = _parse_scoped(html, title_selector, desc_selector, loc_selector)
+    if root is not None:
+        doc, select_one, get_text = root, lambda sel: fast_html.select_one(root, sel), fast_html.text
+    else:
+        doc = BeautifulSoup(html, SOUP_BUILDER)
+        select_one, get_text = doc.select_one, _soup_text
     
     # Title
     title = ""
-    title_elem = soup.select_one(config.get("titleSelector", "h1"))
-    if title_elem:
-        title = title_elem.get_text(strip=True)
-    
-    # Description
-    description = ""
-    desc_elem = soup.select_one(config.get("descriptionSelector", ".job-description"))
-    if desc_elem:
-        description = desc_elem.get_text(separator="\n", strip=True)
-        desc_html = str(desc_elem)
-    else:
-        description = soup.get_text(separator="\n", strip=True)
-        desc_html = description
+    title_elem = select_one(title_selector)
+    if title_elem is not None:
+        title = get_text(title_elem)
+    
+    # Description (whole page text if the selector misses)
+    desc_elem = select_one(desc_selector)
+    description = get_text(desc_elem if desc_elem is not None else doc, "\n")
     
     # Location
     location = None
-    if config.get("locationSelector"):
-        loc_elem = soup.select_one(config["locationSelector"])
-        if loc_elem:
-            location = loc_elem.get_text(strip=True)
+    if loc_selector:
+        loc_elem = select_one(loc_selector)
+        if loc_elem is not None:
+            location = get_text(loc_elem)
     
-    # Extract skills, years, seniority, domain
-    required_skills = extract_skills(desc_html)
+    # Extract skills, years, seniority, domain (from the text, not re-serialized HTML)
+    required_skills = extract_skills(description)
     years_required = extract_years(description)
     seniority = infer_seniority(title, years_required)
     domain = infer_domain(title, required_skills)
@@ -173,13 +353,8 @@ def extract_skills(text: str) -> List[str]:
     if not text:
         return []
     
-    text_lower = text.lower()
-    found = []
-    
-    # Find skills
-    for keyword in TECH_KEYWORDS:
-        if re.search(r"\b" + re.escape(keyword) + r"\b", text_lower):
-            found.append(keyword)
+    # Find skills (one scan; same \b semantics as a per-keyword re.search)
+    found = _skill_matcher().find_all(text.lower())
     
     # Normalize and deduplicate
     normalized = []
@@ -290,48 +465,217 @@ def infer_domain(title: str, skills: List[str]) -> str:
     return "Backend"  # Default
 
 
+# ============================================================================
+# CONCURRENT FETCHING
+# ============================================================================
+
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+# Minimum spacing between request starts to one host (0 = concurrency cap only)
+DEFAULT_HOST_DELAY = 0.0
+# Pause between listing pages; job pages keep downloading meanwhile
+LISTING_PAGE_DELAY = 1.0
+
+
+class HostLimiter:
+    """
+    Caps concurrent requests per host, and optionally spaces their starts at
+    least min_interval seconds apart; the thread pool size caps them globally.
+    """
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, min_interval: float = DEFAULT_HOST_DELAY):
+        self.per_host = max(1, per_host)
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+        with sem:
+            if self.min_interval:
+                # Reserve the next start time under the lock, then wait for it
+                with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start.get(host, 0.0))
+                    self._next_start[host] = start + self.min_interval
+                if start > now:
+                    time.sleep(start - now)
+            yield
+
+
+# Bump when parse_job_page output changes, to invalidate jobs stored in the HTTP cache
+PARSE_VERSION = "3"
+
+
+def job_parse_key(config: Dict) -> str:
+    """Identifies the parser version and selectors a cached job was parsed with."""
+    selectors = {k: config.get(k) for k in ("titleSelector", "descriptionSelector", "locationSelector")}
+    return hashlib.sha256(json.dumps([PARSE_VERSION, selectors], sort_keys=True).encode()).hexdigest()[:16]
+
+
+def fetch_and_parse_job(job_url: str, config: Dict, limiter: HostLimiter,
+                        cache: Optional[HttpCache] = None,
+                        state: Optional[CompanyCrawlState] = None) -> Optional[Dict]:
+    """
+    Download one job page under the host cap, then parse it outside the cap.
+
+    With a cache, an unchanged page (304) returns the job parsed last time.
+    With crawl state, a recently checked posting is returned without any
+    request, and a re-downloaded page with an unchanged body is not re-parsed.
+    """
+    parse_key = job_parse_key(config)
+    if state is not None:
+        job = state.reuse(job_url, parse_key)
+        if job is not None:
+            return job
+
+    with limiter.slot(job_url):
+        job_html, entry, not_modified = fetch_cached(job_url, cache)
+    if not job_html:
+        return state.failed_fetch(job_url) if state is not None else None
+
+    job = None
+    if not_modified and entry.get("parseKey") == parse_key:
+        cache.count("parse_reused")
+        job = entry["job"]
+    body_hash = content_hash(job_html) if state is not None else None
+    if job is None and state is not None:
+        job = state.parsed_job(job_url, body_hash, parse_key)
+    if job is None:
+        job = parse_job_page(job_html, config, job_url)
+        if entry is not None:
+            cache.put(job_url, {**entry, "parseKey": parse_key, "job": job})
+    if state is not None:
+        state.record(job_url, body_hash, parse_key, job)
+    return job
+
+
+def _fetch_and_emit(on_job: Callable[[Dict], None], *args) -> bool:
+    """fetch_and_parse_job, handing the job straight to on_job instead of returning it."""
+    job = fetch_and_parse_job(*args)
+    if not job:
+        return False
+    on_job(job)
+    return True
+
+
 # ============================================================================
 # MAIN SCRAPER
 # ============================================================================
 
-def scrape_company(config: Dict, max_pages: int = 2, verbose: bool = False) -> List[Dict]:
-    """Scrape all jobs from a company."""
+def scrape_company(config: Dict, max_pages: int = 2, verbose: bool = False,
+                   workers: int = DEFAULT_WORKERS, per_host: int = DEFAULT_PER_HOST,
+                   page_delay: float = LISTING_PAGE_DELAY,
+                   cache: Optional[HttpCache] = None,
+                   state: Optional[CompanyCrawlState] = None,
+                   on_job: Optional[Callable[[Dict], None]] = None,
+                   done: Optional[Dict[str, Dict]] = None,
+                   pool: Optional[ThreadPoolExecutor] = None,
+                   limiter: Optional[HostLimiter] = None,
+                   stats: Optional[Dict] = None) -> List[Dict]:
+    """
+    Scrape all jobs from a company.
+
+    Listing pages are walked in order; each job URL is handed to a pool of
+    `workers` threads as soon as it is found, with at most `per_host`
+    requests to one host at a time. Jobs are returned in listing order.
+    With a cache, unchanged pages are revalidated instead of re-downloaded.
+    With crawl state, only new or due postings are fetched, and the run's
+    added/updated/removed report is left in state.report.
+
+    With on_job, each job is passed to it from the worker thread as soon as
+    it is parsed (completion order, not listing order) and is not kept; the
+    returned list is then empty. URLs in `done` (jobs already emitted by an
+    interrupted run) are not fetched again.
+
+    A caller crawling several companies can pass a shared `pool` and
+    `limiter` (then `workers` and `per_host` are ignored) so the budget and
+    per-host caps hold across all of them. `stats`, if given, is filled with
+    the listing pages walked, jobs found and job pages that failed.
+    """
     jobs = []
+    found = 0
+    done = done or {}
+    parse_key = job_parse_key(config)
     next_url = config["careersUrl"]
     page_num = 0
+    failed = 0
     seen = set()
-    
+    limiter = limiter or HostLimiter(per_host)
+    pending = []
+
     logger.info(f"Starting scrape for {config.get('name', 'Company')}...")
-    
-    while next_url and page_num < max_pages:
-        if verbose:
-            logger.info(f"  Page {page_num + 1}: {next_url}")
-        
-        html = fetch_page(next_url)
-        if not html:
-            break
-        
-        job_urls, next_page = parse_job_list(html, config)
-        page_num += 1
-        
-        logger.info(f"  Found {len(job_urls)} jobs")
-        
-        for job_url in job_urls:
-            if job_url in seen:
-                continue
-            seen.add(job_url)
-            
-            job_html = fetch_page(job_url)
-            if not job_html:
-                continue
-            
-            job = parse_job_page(job_html, config, job_url)
-            jobs.append(job)
-        
-        next_url = next_page
-        time.sleep(1)
-    
-    logger.info(f"✅ Found {len(jobs)} total jobs")
+
+    own_pool = pool is None
+    if own_pool:
+        pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="scrape")
+    try:
+        while next_url and page_num < max_pages:
+            if verbose:
+                logger.info(f"  Page {page_num + 1}: {next_url}")
+
+            with limiter.slot(next_url):
+                html, _, _ = fetch_cached(next_url, cache)
+            if not html:
+                break
+
+            job_urls, next_page = parse_job_list(html, config)
+            page_num += 1
+
+            logger.info(f"  Found {len(job_urls)} jobs")
+
+            for job_url in job_urls:
+                if job_url in seen:
+                    continue
+                seen.add(job_url)
+                if job_url in done:
+                    found += 1
+                    if state is not None:
+                        state.record(job_url, None, parse_key, done[job_url])
+                    continue
+                if on_job is not None:
+                    pending.append(pool.submit(_fetch_and_emit, on_job, job_url, config, limiter, cache, state))
+                else:
+                    pending.append(pool.submit(fetch_and_parse_job, job_url, config, limiter, cache, state))
+
+            next_url = next_page
+            if next_url and page_num < max_pages:
+                time.sleep(page_delay)
+        # Only a fully walked listing proves that a missing posting was removed
+        listing_complete = not next_url
+
+        # Collect in submission order so output doesn't depend on network timing
+        for future in pending:
+            job = future.result()
+            if job:
+                found += 1
+                if on_job is None:
+                    jobs.append(job)
+            else:
+                failed += 1
+    finally:
+        if own_pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+        else:
+            for future in pending:
+                future.cancel()
+        if stats is not None:
+            stats.update(pages=page_num, jobs=found, failedJobs=failed, listingComplete=not next_url)
+
+    if cache is not None:
+        logger.info(f"  HTTP cache: {cache.stats()}")
+    if state is not None:
+        # With no listing page fetched nothing was crawled; finish() then leaves the saved state as it was
+        report = state.finish(listing_complete, crawled=page_num > 0)
+        logger.info(f"  Changes: {len(report['added'])} added, {len(report['updated'])} updated, "
+                    f"{len(report['removed'])} removed, {report['unchanged']} unchanged")
+    logger.info(f"✅ Found {found} total jobs")
     return jobs
 
 
@@ -347,8 +691,27 @@ if __name__ == "__main__":
     parser.add_argument("--company", help="Company name (e.g., Google)")
     parser.add_argument("--config", help="Path to company config JSON")
     parser.add_argument("--max-pages", type=int, default=2, help="Max pages to scrape")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Max job pages downloading/parsing at once")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help="Max concurrent requests to any one host")
+    parser.add_argument("--http-cache-dir", default=os.environ.get("SCRAPER_HTTP_CACHE_DIR"),
+                        help="Revalidate pages stored here with conditional GETs "
+                             "(default: $SCRAPER_HTTP_CACHE_DIR; unset disables caching)")
+    parser.add_argument("--state-dir", default=os.environ.get("SCRAPER_STATE_DIR"),
+                        help="Crawl incrementally against per-company state kept here "
+                             "(default: $SCRAPER_STATE_DIR; unset re-crawls everything)")
+    parser.add_argument("--recheck-hours", type=float, default=24.0,
+                        help="With --state-dir, re-fetch known postings last checked this long ago (0 = always)")
+    parser.add_argument("--report", help="With --state-dir, write the added/updated/removed report here")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     parser.add_argument("--output", help="Output file (default: stdout)")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Stream one JSON line per job as it is parsed instead of a JSON array at the end")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="Collapse near-duplicate descriptions into one job with aliases (not with --ndjson)")
+    parser.add_argument("--resume", action="store_true",
+                        help="With --ndjson --output, append to an interrupted run's file and skip jobs already in it")
     
     args = parser.parse_args()
     
@@ -371,15 +734,43 @@ if __name__ == "__main__":
     if not config:
         logger.error("Provide --company or --config")
         sys.exit(1)
+    if args.resume and not (args.ndjson and args.output):
+        logger.error("--resume requires --ndjson and --output")
+        sys.exit(1)
+    if args.dedupe and args.ndjson:
+        logger.error("--dedupe needs the whole result; run near_duplicates.py over the NDJSON instead")
+        sys.exit(1)
     
     # Run scraper
-    jobs = scrape_company(config, max_pages=args.max_pages, verbose=args.verbose)
+    cache = HttpCache(args.http_cache_dir) if args.http_cache_dir else None
+    state = None
+    if args.state_dir:
+        state = CompanyCrawlState(state_path(args.state_dir, config), args.recheck_hours * 3600)
+    options = dict(max_pages=args.max_pages, verbose=args.verbose, workers=args.workers,
+                   per_host=args.per_host, cache=cache, state=state)
+    if args.ndjson:
+        with JobStreamWriter(args.output, resume=args.resume, out=sys.stdout) as stream:
+            if stream.done:
+                logger.info(f"Resuming: {len(stream.done)} jobs already in {args.output}")
+            scrape_company(config, on_job=stream.write, done=stream.done, **options)
+        if args.output:
+            logger.info(f"Streamed {stream.written} jobs to {args.output}")
+    else:
+        jobs = scrape_company(config, **options)
+        if args.dedupe:
+            total = len(jobs)
+            jobs = collapse_duplicates(jobs)
+            logger.info(f"Collapsed {total} postings into {len(jobs)} after near-duplicate detection")
+    if state is not None and args.report:
+        with open(args.report, "w") as f:
+            json.dump(state.report, f, indent=2)
     
     # Output
-    output = json.dumps(jobs, indent=2)
-    if args.output:
-        with open(args.output, "w") as f:
-            f.write(output)
-        logger.info(f"Saved to {args.output}")
-    else:
-        print(output)
+    if not args.ndjson:
+        output = json.dumps(jobs, indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(output)
+            logger.info(f"Saved to {args.output}")
+        else:
+            print(output)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Multi-company crawl orchestrator for company_scraper.py.
+
+Crawls every company in lib/scrapers/companies.json from one process instead
+of one process per company. Up to --companies listing walks run at once,
+and they all submit job pages to one shared pool of --workers threads and
+one HostLimiter, so the global request budget, the --per-host concurrency
+cap and the --host-delay spacing between request starts hold across
+companies that share a careers host.
+
+With --state-dir, companies are scheduled stalest first (never crawled, then
+oldest state file), and each one is crawled incrementally as with
+company_scraper.py --state-dir. A company whose listing can't be fetched
+keeps its old state file, so it stays at the front for the next run.
+
+Jobs from all companies are streamed to one NDJSON output (each record gets
+a "company" field) as they are parsed. The --summary file lists per company:
+wall time, listing pages, jobs, failed job pages and any error.
+
+CLI:
+    python3 scripts/crawl_all.py --output jobs.ndjson --summary summary.json
+        [--companies-file lib/scrapers/companies.json] [--only Google,Meta]
+        [--companies 4] [--workers 16] [--per-host 4] [--host-delay 0.25] [--max-pages 2]
+        [--http-cache-dir .http-cache] [--state-dir .crawl-state] [--recheck-hours 24]
+
+Run from the repository root (the default companies file is relative to it).
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from company_scraper import scrape_company, HostLimiter, DEFAULT_PER_HOST  # noqa: E402
+from crawl_state import CompanyCrawlState, last_crawled, state_path  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+from job_stream import JobStreamWriter  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPANIES_FILE = "lib/scrapers/companies.json"
+DEFAULT_CONCURRENT_COMPANIES = 4
+DEFAULT_GLOBAL_WORKERS = 16
+# Crawling many companies at once makes shared hosts busier, so space requests by default
+DEFAULT_CRAWL_HOST_DELAY = 0.25
+
+
+def crawl_order(companies: List[Dict], state_dir: Optional[str]) -> List[Dict]:
+    """Stalest first when crawl state is kept; otherwise file order."""
+    if not state_dir:
+        return list(companies)
+    # sorted() is stable, so companies never crawled keep their file order
+    return sorted(companies, key=lambda c: _last_crawled(c, state_dir))
+
+
+def _last_crawled(config: Dict, state_dir: str) -> float:
+    # A config without careersUrl sorts first; crawl_one reports its error
+    if not config.get("careersUrl"):
+        return 0.0
+    return last_crawled(state_path(state_dir, config))
+
+
+def crawl_one(config: Dict, stream: JobStreamWriter, pool: ThreadPoolExecutor, limiter: HostLimiter,
+              max_pages: int, cache: Optional[HttpCache], state_dir: Optional[str],
+              recheck_hours: float) -> Dict:
+    """Crawl one company into the shared stream; never raises, errors go in the summary."""
+    name = config.get("name", "Company")
+    summary = {"company": name, "pages": 0, "jobs": 0, "failedJobs": 0, "listingComplete": False,
+               "seconds": 0.0, "error": None}
+    start = time.perf_counter()
+    try:
+        state = None
+        if state_dir:
+            state = CompanyCrawlState(state_path(state_dir, config), recheck_hours * 3600)
+        scrape_company(config, max_pages=max_pages, cache=cache, state=state,
+                       on_job=lambda job: stream.write({**job, "company": name}),
+                       pool=pool, limiter=limiter, stats=summary)
+        if state is not None:
+            report = state.report
+            summary["changes"] = {"added": len(report["added"]), "updated": len(report["updated"]),
+                                  "removed": len(report["removed"]), "unchanged": report["unchanged"]}
+        if summary["pages"] == 0:
+            summary["error"] = "listing page could not be fetched"
+    except KeyError as e:
+        logger.error(f"{name}: missing config field {e}")
+        summary["error"] = f"missing config field {e}"
+    except Exception as e:  # one broken config must not stop the catalog refresh
+        logger.error(f"{name}: {e}")
+        summary["error"] = str(e)
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def crawl_all(companies: List[Dict], stream: JobStreamWriter,
+              concurrent_companies: int = DEFAULT_CONCURRENT_COMPANIES,
+              workers: int = DEFAULT_GLOBAL_WORKERS, per_host: int = DEFAULT_PER_HOST,
+              max_pages: int = 2, cache: Optional[HttpCache] = None,
+              state_dir: Optional[str] = None, recheck_hours: float = 24.0,
+              host_delay: float = DEFAULT_CRAWL_HOST_DELAY) -> List[Dict]:
+    """
+    Crawl companies concurrently under one worker budget, per-host cap and
+    per-host minimum spacing between request starts.
+
+    Returns:
+        Per-company summaries in crawl order
+    """
+    limiter = HostLimiter(per_host, host_delay)
+    ordered = crawl_order(companies, state_dir)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="scrape") as pool, \
+            ThreadPoolExecutor(max_workers=max(1, concurrent_companies), thread_name_prefix="company") as walkers:
+        futures = [walkers.submit(crawl_one, config, stream, pool, limiter, max_pages, cache,
+                                  state_dir, recheck_hours)
+                   for config in ordered]
+        return [future.result() for future in futures]
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Crawl every configured company concurrently")
+    parser.add_argument("--companies-file", default=DEFAULT_COMPANIES_FILE, help="Company configs (JSON array)")
+    parser.add_argument("--only", help="Comma-separated company names to crawl (default: all)")
+    parser.add_argument("--companies", type=int, default=DEFAULT_CONCURRENT_COMPANIES,
+                        help="Companies whose listings are walked at once")
+    parser.add_argument("--workers", type=int, default=DEFAULT_GLOBAL_WORKERS,
+                        help="Job pages downloading/parsing at once across all companies")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help="Max concurrent requests to any one host across all companies")
+    parser.add_argument("--host-delay", type=float, default=DEFAULT_CRAWL_HOST_DELAY,
+                        help="Min seconds between request starts to any one host (0 = concurrency cap only)")
+    parser.add_argument("--max-pages", type=int, default=2, help="Max listing pages per company")
+    parser.add_argument("--http-cache-dir", default=os.environ.get("SCRAPER_HTTP_CACHE_DIR"),
+                        help="Revalidate pages stored here with conditional GETs")
+    parser.add_argument("--state-dir", default=os.environ.get("SCRAPER_STATE_DIR"),
+                        help="Crawl incrementally and stalest-first against state kept here")
+    parser.add_argument("--recheck-hours", type=float, default=24.0,
+                        help="With --state-dir, re-fetch known postings last checked this long ago")
+    parser.add_argument("--output", help="Combined NDJSON output (default: stdout)")
+    parser.add_argument("--summary", help="Write the per-company summary JSON here (default: stderr log only)")
+    args = parser.parse_args()
+
+    try:
+        with open(args.companies_file) as f:
+            companies = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Cannot read {args.companies_file}: {e}")
+        sys.exit(1)
+    if args.only:
+        wanted = {name.strip().lower() for name in args.only.split(",")}
+        companies = [c for c in companies if c.get("name", "").lower() in wanted]
+    if not companies:
+        logger.error("No companies to crawl")
+        sys.exit(1)
+
+    cache = HttpCache(args.http_cache_dir) if args.http_cache_dir else None
+    start = time.perf_counter()
+    with JobStreamWriter(args.output, out=sys.stdout) as stream:
+        summaries = crawl_all(companies, stream, concurrent_companies=args.companies, workers=args.workers,
+                              per_host=args.per_host, max_pages=args.max_pages, cache=cache,
+                              state_dir=args.state_dir, recheck_hours=args.recheck_hours,
+                              host_delay=args.host_delay)
+    report = {
+        "seconds": round(time.perf_counter() - start, 3),
+        "jobs": stream.written,
+        "failedCompanies": sum(1 for s in summaries if s["error"]),
+        "companies": summaries
+    }
+
+    for s in summaries:
+        status = f"error: {s['error']}" if s["error"] else "ok"
+        logger.info(f"  {s['company']}: {s['jobs']} jobs, {s['pages']} pages, {s['seconds']}s ({status})")
+    logger.info(f"✅ {report['jobs']} jobs from {len(summaries)} companies in {report['seconds']}s")
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Summary saved to {args.summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Persistent per-company crawl state for incremental company_scraper.py runs.
+
+For every job URL seen, the state file keeps the SHA-256 of the page body,
+the parse settings and the parsed job dict, and when it was last checked.
+A run then only downloads postings that are new or due for a recheck, skips
+parse_job_page when a re-downloaded page hashes the same, and reports which
+jobs were added, updated or removed since the previous run.
+
+State lives in one JSON file per company under the state directory and is
+replaced atomically at the end of a run.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+
+def state_path(state_dir: str, config: Dict) -> str:
+    """State file for a company config: name slug plus a hash of its careers URL."""
+    slug = re.sub(r"[^a-z0-9]+", "-", config.get("name", "").lower()).strip("-") or "company"
+    url_hash = hashlib.sha256(config["careersUrl"].encode('utf-8')).hexdigest()[:8]
+    return os.path.join(state_dir, f"{slug}-{url_hash}.json")
+
+
+def last_crawled(path: str) -> float:
+    """When the state file was last saved (epoch seconds), or 0 if never."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return float(data.get("updatedAt", 0)) if isinstance(data, dict) else 0.0
+    except (OSError, ValueError, TypeError):
+        return 0.0
+
+
+class CompanyCrawlState:
+    """Known jobs for one company plus the changes observed during the current run."""
+
+    def __init__(self, path: str, recheck_after: float = 24 * 3600):
+        self.path = path
+        # Known postings checked more recently than this (seconds) are reused without a request
+        self.recheck_after = recheck_after
+        self._lock = threading.Lock()
+        self.jobs: Dict[str, Dict] = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get("jobs"), dict):
+                self.jobs = data["jobs"]
+        except (OSError, ValueError):
+            pass
+        self._seen = set()
+        self.added: List[str] = []
+        self.updated: List[str] = []
+        self.unchanged = 0
+        self.reused = 0
+        self.failed = 0
+        self.report: Optional[Dict] = None
+
+    def reuse(self, url: str, parse_key: str) -> Optional[Dict]:
+        """The stored job if it was checked recently enough to skip fetching, else None."""
+        with self._lock:
+            entry = self.jobs.get(url)
+            if (entry is None or entry.get("parseKey") != parse_key
+                    or time.time() - entry.get("checkedAt", 0) >= self.recheck_after):
+                return None
+            self._seen.add(url)
+            self.unchanged += 1
+            self.reused += 1
+            return entry["job"]
+
+    def parsed_job(self, url: str, body_hash: str, parse_key: str) -> Optional[Dict]:
+        """The stored job if the page body and parse settings are unchanged, else None."""
+        with self._lock:
+            entry = self.jobs.get(url)
+            if entry and entry.get("hash") == body_hash and entry.get("parseKey") == parse_key:
+                return entry["job"]
+            return None
+
+    def record(self, url: str, body_hash: str, parse_key: str, job: Dict) -> None:
+        """Store a freshly checked posting and classify it as added, updated or unchanged."""
+        with self._lock:
+            previous = self.jobs.get(url)
+            if previous is None:
+                self.added.append(url)
+            elif previous.get("job") != job:
+                self.updated.append(url)
+            else:
+                self.unchanged += 1
+            self.jobs[url] = {"hash": body_hash, "parseKey": parse_key, "job": job,
+                              "checkedAt": time.time()}
+            self._seen.add(url)
+
+    def failed_fetch(self, url: str) -> Optional[Dict]:
+        """A known posting could not be fetched: keep it (and return it) rather than drop it."""
+        with self._lock:
+            self.failed += 1
+            entry = self.jobs.get(url)
+            if entry is None:
+                return None
+            self._seen.add(url)
+            return entry["job"]
+
+    def finish(self, listing_complete: bool, crawled: bool = True) -> Dict:
+        """
+        Drop postings that no longer appear in the listing, save, and return
+        the change report. Removals are only inferred when every listing page
+        was walked; a truncated crawl (max_pages hit, fetch failure) keeps them.
+        With crawled=False (not even the first listing page was fetched) the
+        state file is left untouched, so its updatedAt still says how stale
+        the company is.
+        """
+        with self._lock:
+            removed = []
+            if listing_complete:
+                removed = [url for url in self.jobs if url not in self._seen]
+                for url in removed:
+                    del self.jobs[url]
+            report = {
+                "added": list(self.added),
+                "updated": list(self.updated),
+                "removed": removed,
+                "unchanged": self.unchanged,
+                "reusedWithoutFetch": self.reused,
+                "failed": self.failed,
+                "removalsChecked": listing_complete,
+                "known": len(self.jobs)
+            }
+            if crawled:
+                self._save()
+        self.report = report
+        return report
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # Write then rename so a crash mid-save keeps the previous state
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"updatedAt": time.time(), "jobs": self.jobs}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+lxml-backed fast path for company_scraper.py's page parsing.
+
+BeautifulSoup with the stdlib "html.parser" builds a Python object for every
+node of a page, most of which the scraper never looks at. When lxml is
+installed, pages are parsed by libxml2 into a C tree instead, the configured
+CSS selectors are translated to XPath and evaluated there, and text is only
+materialized for the elements that were selected.
+
+Only the selector subset career-page configs use is translated: type, #id,
+.class and attribute selectors ([a], =, ~=, |=, ^=, $=, *=), groups with ","
+and the descendant / child combinators. Anything else (pseudo-classes,
+sibling combinators, ...) makes to_xpath() return None and the caller falls
+back to BeautifulSoup.
+
+text() reproduces Tag.get_text(separator, strip=True): comments and the
+contents of <script>, <style> and <template> are skipped.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAVE_LXML = True
+except ImportError:  # optional dependency; BeautifulSoup is used instead
+    HAVE_LXML = False
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_SKIPPED_TEXT_TAGS = {"script", "style", "template"}
+
+_COMPOUND_RE = re.compile(
+    r"\s*(?P<tag>\*|[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+|\[[^\]]*\])*)\s*(?P<comb>>|(?=\S)|$)"
+)
+_SIMPLE_RE = re.compile(r"([.#])([\w-]+)|\[([^\]]*)\]")
+_ATTRIBUTE_RE = re.compile(
+    r"^\s*(?P<name>[\w-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:\"(?P<dq>[^\"]*)\"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?$"
+)
+
+
+def _literal(value: str) -> Optional[str]:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return None
+
+
+def _token_test(attr: str, value: str) -> str:
+    return f"contains(concat(' ', normalize-space({attr}), ' '), ' {value} ')"
+
+
+def _attribute_test(text: str) -> Optional[str]:
+    m = _ATTRIBUTE_RE.match(text)
+    if not m:
+        return None
+    attr = "@" + m.group("name").lower()
+    op = m.group("op")
+    if op is None:
+        return attr
+    value = next(v for v in (m.group("dq"), m.group("sq"), m.group("bare")) if v is not None)
+    literal = _literal(value)
+    if literal is None:
+        return None
+    if op == "=":
+        return f"{attr}={literal}"
+    if op == "~=":
+        return _token_test(attr, value) if value and not re.search(r"[\s']", value) else "false()"
+    if op == "|=":
+        return f"({attr}={literal} or starts-with({attr}, {_literal(value + '-')}))"
+    if not value:
+        return "false()"  # ^= $= *= with an empty value never match
+    if op == "^=":
+        return f"starts-with({attr}, {literal})"
+    if op == "*=":
+        return f"contains({attr}, {literal})"
+    return f"substring({attr}, string-length({attr}) - {len(value) - 1}) = {literal}"
+
+
+def _compound_to_xpath(tag: Optional[str], rest: str) -> Optional[str]:
+    step = (tag or "*").lower()
+    pos = 0
+    for m in _SIMPLE_RE.finditer(rest):
+        if m.start() != pos:
+            return None
+        pos = m.end()
+        if m.group(1) == ".":
+            test = _token_test("@class", m.group(2))
+        elif m.group(1) == "#":
+            test = f"@id='{m.group(2)}'"
+        else:
+            test = _attribute_test(m.group(3))
+            if test is None:
+                return None
+        step += f"[{test}]"
+    return step if pos == len(rest) else None
+
+
+@lru_cache(maxsize=256)
+def to_xpath(selector: str) -> Optional[str]:
+    """XPath equivalent of a CSS selector group, or None if it uses unsupported syntax."""
+    paths = []
+    for group in selector.split(","):
+        group = group.strip()
+        if not group:
+            return None
+        path = ""
+        axis = "//"
+        pos = 0
+        while pos < len(group):
+            m = _COMPOUND_RE.match(group, pos)
+            if not m or m.end() == pos or not (m.group("tag") or m.group("rest")):
+                return None
+            step = _compound_to_xpath(m.group("tag"), m.group("rest"))
+            if step is None:
+                return None
+            path += axis + step
+            axis = "/" if m.group("comb") == ">" else "//"
+            pos = m.end()
+        if axis == "/":
+            return None  # dangling ">"
+        paths.append(path)
+    return " | ".join(paths)
+
+
+@lru_cache(maxsize=256)
+def _compiled(selector: str):
+    xpath = to_xpath(selector)
+    return etree.XPath(xpath) if xpath is not None else None
+
+
+def supports(*selectors: Optional[str]) -> bool:
+    """True if lxml is available and every given selector can be translated."""
+    return HAVE_LXML and all(s is None or to_xpath(s) is not None for s in selectors)
+
+
+def parse(html: str):
+    """Parse a page into an lxml tree, or None if lxml can't take it (caller falls back)."""
+    if not HAVE_LXML or not html or not html.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def select(root, selector: str) -> List:
+    """All elements matching a supported selector, in document order."""
+    return _compiled(selector)(root)
+
+
+def select_one(root, selector: str):
+    matches = _compiled(selector)(root)
+    return matches[0] if matches else None
+
+
+def text(element, separator: str = "") -> str:
+    """Equivalent of BeautifulSoup's element.get_text(separator, strip=True)."""
+    parts = []
+
+    def add(s: Optional[str]) -> None:
+        if s:
+            s = s.strip()
+            if s:
+                parts.append(s)
+
+    def walk(el) -> None:
+        if isinstance(el.tag, str) and el.tag not in _SKIPPED_TEXT_TAGS:
+            add(el.text)
+            for child in el:
+                walk(child)
+                add(child.tail)
+        # Comments, processing instructions and skipped tags contribute nothing
+        # themselves; their tails are added by the parent above
+
+    walk(element)
+    return separator.join(parts)
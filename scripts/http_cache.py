@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+On-disk conditional-GET cache for company_scraper.py.
+
+One JSON file per URL holds the last 200 response body with its ETag and
+Last-Modified validators, plus the job parsed from it. A re-fetch sends
+If-None-Match / If-Modified-Since; on a 304 the stored body is reused and,
+when the parse settings still match, so is the stored job, so neither the
+download nor parse_job_page is repeated for an unchanged posting.
+
+Entries are rewritten in place, so the directory only grows with the number
+of distinct URLs; delete it to start over.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+class HttpCache:
+    """Directory of {url, etag, lastModified, body, parseKey, job} entries."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.not_modified = 0
+        self.downloaded = 0
+        self.parse_reused = 0
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the stored entry for a URL, or None."""
+        try:
+            with open(self._path(url), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or "body" not in entry:
+            return None
+        return entry
+
+    def put(self, url: str, entry: Dict) -> None:
+        """Store an entry. Best-effort: a full disk only costs future revalidations."""
+        path = self._path(url)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({**entry, "url": url}, f)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError:
+            pass
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Revalidation headers for a stored entry (empty if it has no validators)."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("lastModified"):
+                headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+    def count(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "notModified": self.not_modified,
+                "downloaded": self.downloaded,
+                "parseReused": self.parse_reused
+            }
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON job output for company_scraper.py.
+
+Each parsed job is written as one JSON line and flushed as soon as it is
+ready, so a consumer can read postings while the crawl is still running and
+the scraper never holds the full result set in memory.
+
+An output file can be resumed after a crash: the jobs already in it are read
+back (a torn last line is cut off), their URLs are not fetched again, and new
+records are appended.
+
+Files are written as UTF-8; records sent to a caller's stream such as stdout
+are ASCII-escaped so a non-UTF-8 locale can't fail mid-crawl.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, Optional, TextIO
+
+
+def read_jobs(path: str) -> Dict[str, Dict]:
+    """
+    Jobs already written to an NDJSON file, keyed by URL, and cut off a
+    partial last line left by a crash. A missing file is an empty result.
+    """
+    jobs = {}
+    try:
+        with open(path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                f.truncate(end)
+    except FileNotFoundError:
+        return jobs
+    for line in data[:end].splitlines():
+        try:
+            job = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(job, dict) and job.get("url"):
+            jobs[job["url"]] = job
+    return jobs
+
+
+class JobStreamWriter:
+    """Thread-safe NDJSON sink; workers call write() as each job is parsed."""
+
+    def __init__(self, path: Optional[str] = None, resume: bool = False,
+                 out: Optional[TextIO] = None):
+        self.path = path
+        # Jobs recovered from an interrupted run; scrape_company doesn't fetch them again
+        self.done: Dict[str, Dict] = read_jobs(path) if path and resume else {}
+        self._lock = threading.Lock()
+        self.written = 0
+        if path:
+            self._out = open(path, 'a' if resume else 'w', encoding='utf-8')
+            self._owned = True
+        else:
+            self._out = out
+            self._owned = False
+        # A caller's stream (stdout) may not be UTF-8 under the current locale
+        self._ensure_ascii = not self._owned
+
+    def write(self, job: Dict) -> None:
+        line = json.dumps(job, ensure_ascii=self._ensure_ascii) + "\n"
+        with self._lock:
+            self._out.write(line)
+            self._out.flush()
+            self.written += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._out.flush()
+            if self._owned:
+                try:
+                    os.fsync(self._out.fileno())
+                except OSError:
+                    pass  # not a regular file (e.g. /dev/null, a FIFO)
+                self._out.close()
+
+    def __enter__(self) -> "JobStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
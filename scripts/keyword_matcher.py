@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Single-pass multi-keyword matcher used by company_scraper.extract_skills.
+
+Matches exactly what a separate re.search(r"\\b" + re.escape(k) + r"\\b")
+per keyword would find (including tokens such as "c++", "c#" and "next.js",
+whose boundaries fall next to punctuation), but in one scan of the text:
+
+- every keyword goes into a character trie that is compiled into one regex,
+  so the cost per text position depends on the trie depth, not on the
+  vocabulary size;
+- the trie sits inside a lookahead, so matches that overlap or start inside
+  another match are still found;
+- at each position the regex reports the longest keyword whose boundaries
+  hold; shorter keywords starting at the same position are, by
+  construction, its prefixes and are checked individually.
+"""
+
+import re
+from typing import Dict, Iterable, List, Pattern, Tuple
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Regex matching any of words, with alternatives factored by common prefix."""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end-of-word marker
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: try the longer keyword first, fall back to ending here
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Find every keyword from a fixed vocabulary in a text, in one pass."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted(set(k for k in keywords if k))
+        self._pattern = re.compile(r"(?=\b(" + _trie_regex(self.keywords) + r")\b)") if self.keywords else None
+        # Keyword -> shorter keywords that are its prefixes, with their end-boundary checks
+        self._prefixes: Dict[str, List[Tuple[str, Pattern]]] = {}
+        vocabulary = set(self.keywords)
+        for keyword in self.keywords:
+            shorter = [keyword[:n] for n in range(1, len(keyword)) if keyword[:n] in vocabulary]
+            if shorter:
+                self._prefixes[keyword] = [(k, re.compile(re.escape(k) + r"\b")) for k in shorter]
+
+    def find_all(self, text: str) -> List[str]:
+        """Distinct keywords found in text, in order of first occurrence."""
+        if self._pattern is None or not text:
+            return []
+        found: Dict[str, None] = {}
+        for m in self._pattern.finditer(text):
+            keyword = m.group(1)
+            for shorter, end_check in self._prefixes.get(keyword, ()):
+                if shorter not in found and end_check.match(text, m.start()):
+                    found[shorter] = None
+            found.setdefault(keyword, None)
+        return list(found)
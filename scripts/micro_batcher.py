@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Micro-batching scheduler for concurrent predictions.
+
+Callers submit single feature rows from any thread. A background thread
+collects rows until either max_batch rows are waiting or window_ms has
+passed since the first one arrived, runs them through one batched call,
+and resolves each caller's future with its own row of the result.
+
+The window bounds the extra latency a request can pick up from waiting,
+so p99 stays at roughly window_ms + one batched forward pass while
+throughput under bursty load approaches the batched rate.
+"""
+
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 64
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-row requests into batched calls of batch_fn."""
+
+    def __init__(self, batch_fn: Callable[[np.ndarray], np.ndarray],
+                 window_ms: float = DEFAULT_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH):
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self.batch_fn = batch_fn
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, row: np.ndarray) -> Future:
+        """Queue one feature row; the future resolves to its output row."""
+        future: Future = Future()
+        self._queue.put((row, future))
+        return future
+
+    def close(self, timeout: float = None) -> None:
+        """Finish queued requests, then stop the worker thread."""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        """Batch counters for the health probe."""
+        with self._stats_lock:
+            return {
+                "batches": self.batches,
+                "requests": self.requests,
+                "meanBatchSize": round(self.requests / self.batches, 2) if self.batches else 0.0,
+                "largestBatch": self.largest_batch,
+                "windowMs": self.window * 1000.0,
+                "maxBatch": self.max_batch
+            }
+
+    def _collect(self, first) -> Tuple[List, bool]:
+        """Gather up to max_batch items within the window after the first."""
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect(item)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List) -> None:
+        live = [(row, future) for row, future in batch if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        rows = [row for row, _ in live]
+        futures = [future for _, future in live]
+        try:
+            stacked = np.stack(rows)
+        except ValueError:
+            # A malformed row must not fail the callers it was co-batched with
+            for row, future in live:
+                self._dispatch_one(row, future)
+            return
+        try:
+            results = self.batch_fn(stacked)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            future.set_result(result)
+        self._count(len(rows))
+
+    def _dispatch_one(self, row: np.ndarray, future: Future) -> None:
+        try:
+            result = self.batch_fn(np.asarray(row)[None])[0]
+        except Exception as e:
+            future.set_exception(e)
+            return
+        future.set_result(result)
+        self._count(1)
+
+    def _count(self, n_rows: int) -> None:
+        with self._stats_lock:
+            self.batches += 1
+            self.requests += n_rows
+            self.largest_batch = max(self.largest_batch, n_rows)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate job posting detection for company_scraper.py output.
+
+Companies cross-post one role under several URLs (per location, per listing
+page) with descriptions that differ only in a location line or a footer.
+These are collapsed into the first posting seen, which keeps the others in
+an "aliases" list of {url, location}.
+
+Each description is cut into overlapping word 5-shingles and summarized by a
+128-value MinHash signature. One hash per shingle is computed and binned
+(one-permutation hashing, empty bins densified by rotation), so a signature
+costs O(shingles) in pure Python rather than O(shingles x 128). Shingles
+are hashed with Python's (per-process salted) string hash, so signatures
+are only comparable within one run and are never persisted.
+Signatures are split into 16 bands of 8 values for LSH: only postings that
+agree on a whole band are compared, and a pair is a duplicate when the
+estimated Jaccard similarity of their shingle sets is >= --threshold.
+
+Each posting is compared only against the canonical postings already
+indexed, never against aliases, so a cluster can't drift through chains of
+slightly-similar postings, and a large duplicate cluster costs one
+comparison per member: the pass stays close to linear in the number of
+postings.
+
+CLI (JSON array or NDJSON in; same format out):
+    python3 scripts/near_duplicates.py jobs.ndjson [--output deduped.ndjson] [--threshold 0.8]
+"""
+
+import re
+import sys
+import json
+from typing import Dict, Hashable, List, Optional, Tuple
+
+NUM_BINS = 128
+BANDS = 16
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+
+_MASK64 = (1 << 64) - 1
+_EMPTY = _MASK64
+_WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Overlapping word n-grams of the lowercased text; a shorter text is one shingle."""
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def signature(text: str, num_bins: int = NUM_BINS) -> Optional[List[int]]:
+    """Densified one-permutation MinHash signature, or None for a text without words."""
+    sig = [_EMPTY] * num_bins
+    found = False
+    for shingle in shingles(text):
+        h = hash(shingle) & _MASK64
+        b, v = h % num_bins, h // num_bins
+        if v < sig[b]:
+            sig[b] = v
+        found = True
+    if not found:
+        return None
+    # Rotation densification: an empty bin borrows the next non-empty bin to its
+    # right; the distance goes in the high bits so borrowed values never equal real ones
+    span = (_MASK64 + 1) // num_bins
+    for b in range(num_bins):
+        if sig[b] != _EMPTY:
+            continue
+        for step in range(1, num_bins):
+            v = sig[(b + step) % num_bins]
+            if v < span:
+                sig[b] = v + step * span
+                break
+    return sig
+
+
+def similarity(a: List[int], b: List[int]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class NearDuplicateIndex:
+    """Incremental LSH index over canonical postings."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_bins: int = NUM_BINS, bands: int = BANDS):
+        if num_bins % bands:
+            raise ValueError("num_bins must be a multiple of bands")
+        self.threshold = threshold
+        self.num_bins = num_bins
+        self.bands = bands
+        self.rows = num_bins // bands
+        self._buckets: List[Dict[tuple, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, List[int]] = {}
+        self.comparisons = 0
+
+    def add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        Return the key of the canonical posting `text` duplicates, or None
+        after indexing it as a new canonical posting.
+        """
+        sig = signature(text, self.num_bins)
+        if sig is None:
+            return None
+        band_keys = [tuple(sig[i * self.rows:(i + 1) * self.rows]) for i in range(self.bands)]
+
+        best, best_sim = None, self.threshold
+        checked = set()
+        for band, band_key in zip(self._buckets, band_keys):
+            for candidate in band.get(band_key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                self.comparisons += 1
+                sim = similarity(sig, self._signatures[candidate])
+                if sim >= best_sim:
+                    best, best_sim = candidate, sim
+        if best is not None:
+            return best
+
+        self._signatures[key] = sig
+        for band, band_key in zip(self._buckets, band_keys):
+            band.setdefault(band_key, []).append(key)
+        return None
+
+
+def collapse_duplicates(jobs: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Collapse near-duplicate descriptions into the first posting of each group.
+
+    Postings are only compared within the same "company" (when set). Every
+    returned job has an "aliases" list of {url, location} for the postings
+    folded into it; order follows the first posting of each group.
+    """
+    indexes: Dict[Optional[str], NearDuplicateIndex] = {}
+    canonical: List[Dict] = []
+    # Input position of each canonical job -> its position in `canonical`
+    position: Dict[int, int] = {}
+    for i, job in enumerate(jobs):
+        index = indexes.get(job.get("company"))
+        if index is None:
+            index = indexes[job.get("company")] = NearDuplicateIndex(threshold)
+        match = index.add(i, job.get("description", ""))
+        if match is None:
+            position[i] = len(canonical)
+            canonical.append({**job, "aliases": []})
+        else:
+            canonical[position[match]]["aliases"].append({"url": job.get("url"), "location": job.get("location")})
+    return canonical
+
+
+def read_jobs(path: str) -> Tuple[List[Dict], bool]:
+    """Jobs from a JSON array or NDJSON file ('-' = stdin), and whether it was NDJSON."""
+    f = sys.stdin if path == "-" else open(path, encoding='utf-8')
+    try:
+        data = f.read()
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    if data.lstrip().startswith("["):
+        return json.loads(data), False
+    return [json.loads(line) for line in data.splitlines() if line.strip()], True
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Collapse near-duplicate job postings")
+    parser.add_argument("input", help="Scraped jobs: JSON array or NDJSON ('-' = stdin)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Estimated Jaccard similarity of description shingles to count as a duplicate")
+    parser.add_argument("--output", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    try:
+        jobs, ndjson = read_jobs(args.input)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    deduped = collapse_duplicates(jobs, args.threshold)
+    if ndjson:
+        output = "".join(json.dumps(job, ensure_ascii=False) + "\n" for job in deduped)
+    else:
+        output = json.dumps(deduped, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding='utf-8') as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output)
+    print(f"{len(jobs)} postings -> {len(deduped)} after collapsing near-duplicates", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+TensorFlow-free inference engine for the job matching model.
+
+The Keras model is a small Sequential stack of Dense / BatchNormalization /
+Dropout layers. The export step reads its weights straight out of the .h5
+file with h5py, folds each (inference-mode) BatchNormalization into the next
+Dense layer, and writes a compact .npz. The runtime then evaluates the
+forward pass with plain NumPy, so predict.py can run without importing
+TensorFlow.
+
+CLI:
+    python3 scripts/numpy_model.py export [--h5 models/intelligent_model.h5] [--out models/intelligent_model.npz]
+    python3 scripts/numpy_model.py check-parity [--samples 2048] [--tolerance 1e-5]
+
+check-parity needs TensorFlow; it loads both backends, runs them on the same
+random inputs and exits non-zero if any output differs by more than the
+tolerance.
+"""
+
+import sys
+import json
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+H5_PATH = 'models/intelligent_model.h5'
+NPZ_PATH = 'models/intelligent_model.npz'
+
+FORMAT_VERSION = 1
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp(-x))
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    e = np.exp(x - x.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
+
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0, out=x),
+    'sigmoid': _sigmoid,
+    'tanh': np.tanh,
+    'softmax': _softmax,
+}
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def _layer_weights(h5file, layer_name: str) -> Dict[str, np.ndarray]:
+    """Collect a layer's weight arrays by short name (kernel, bias, gamma, ...)."""
+    weights: Dict[str, np.ndarray] = {}
+    group = h5file['model_weights'].get(layer_name)
+    if group is None:
+        return weights
+
+    def visit(name, obj):
+        if hasattr(obj, 'shape'):
+            short = name.rsplit('/', 1)[-1].split(':')[0]
+            weights[short] = np.asarray(obj[()], dtype=np.float32)
+
+    group.visititems(visit)
+    return weights
+
+
+def read_h5_layers(h5_path: str) -> List[Tuple]:
+    """
+    Read a Sequential model's layers from a Keras .h5 file.
+
+    Returns:
+        List of ('dense', kernel, bias, activation) and ('affine', scale, shift)
+        tuples in forward order. Dropout and InputLayer are identities at
+        inference time and are dropped.
+    """
+    import h5py
+
+    layers: List[Tuple] = []
+    with h5py.File(h5_path, 'r') as f:
+        config = json.loads(f.attrs['model_config'])
+        if config.get('class_name') != 'Sequential':
+            raise ValueError(f"Unsupported model class: {config.get('class_name')}")
+
+        for layer in config['config']['layers']:
+            kind = layer['class_name']
+            cfg = layer['config']
+            if kind in ('InputLayer', 'Dropout'):
+                continue
+            weights = _layer_weights(f, cfg['name'])
+            if kind == 'Dense':
+                activation = cfg.get('activation', 'linear')
+                if activation not in ACTIVATIONS:
+                    raise ValueError(f"Unsupported activation: {activation}")
+                kernel = weights['kernel']
+                bias = weights.get('bias', np.zeros(kernel.shape[1], dtype=np.float32))
+                layers.append(('dense', kernel, bias, activation))
+            elif kind == 'BatchNormalization':
+                if cfg.get('axis', -1) not in (-1, [-1], 1, [1]):
+                    raise ValueError(f"Unsupported BatchNormalization axis: {cfg.get('axis')}")
+                mean = weights['moving_mean']
+                variance = weights['moving_variance']
+                gamma = weights.get('gamma', np.ones_like(mean))
+                beta = weights.get('beta', np.zeros_like(mean))
+                scale = gamma / np.sqrt(variance + np.float32(cfg.get('epsilon', 1e-3)))
+                layers.append(('affine', scale, beta - mean * scale))
+            else:
+                raise ValueError(f"Unsupported layer type: {kind}")
+    return layers
+
+
+def fold_layers(layers: List[Tuple]) -> List[Tuple]:
+    """
+    Fold each affine (BatchNormalization) layer into the Dense layer after it.
+
+    Dense(W, b) applied to (x * s + t) equals Dense(diag(s) W, b + t W), so the
+    folded network does one matmul per Dense layer and nothing else.
+    """
+    folded: List[Tuple] = []
+    pending: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    for layer in layers:
+        if layer[0] == 'affine':
+            _, scale, shift = layer
+            if pending is not None:
+                scale, shift = pending[0] * scale, pending[1] * scale + shift
+            pending = (scale, shift)
+            continue
+        _, kernel, bias, activation = layer
+        if pending is not None:
+            scale, shift = pending
+            bias = bias + shift.astype(np.float64) @ kernel.astype(np.float64)
+            kernel = kernel * scale[:, None]
+            pending = None
+        folded.append(('dense', kernel.astype(np.float32), np.asarray(bias, dtype=np.float32), activation))
+    if pending is not None:
+        # Trailing BatchNormalization has no Dense to fold into; keep it as a scale/shift
+        folded.append(('affine', pending[0].astype(np.float32), pending[1].astype(np.float32)))
+    return folded
+
+
+def export_npz(h5_path: str = H5_PATH, npz_path: str = NPZ_PATH) -> int:
+    """
+    Export a Keras .h5 model to the compact .npz format used by NumpyModel.
+
+    Returns:
+        Number of layers written
+    """
+    layers = fold_layers(read_h5_layers(h5_path))
+    arrays: Dict[str, np.ndarray] = {
+        'format_version': np.array(FORMAT_VERSION),
+        'source_sha256': np.array(file_sha256(h5_path)),
+        'kinds': np.array([layer[0] for layer in layers]),
+        'activations': np.array([layer[3] if layer[0] == 'dense' else 'linear' for layer in layers]),
+    }
+    for i, layer in enumerate(layers):
+        arrays[f'w{i}'] = layer[1]
+        arrays[f'b{i}'] = layer[2]
+    np.savez(npz_path, **arrays)
+    return len(layers)
+
+
+# ============================================================================
+# RUNTIME
+# ============================================================================
+
+class NumpyModel:
+    """Forward pass over exported weights; mirrors Keras' model.predict()."""
+
+    def __init__(self, kinds: List[str], activations: List[str],
+                 weights: List[np.ndarray], biases: List[np.ndarray], source_sha256: str = ''):
+        self.kinds = list(kinds)
+        self.activations = list(activations)
+        self.source_sha256 = source_sha256
+        self.layers = [
+            (kind, w, b, ACTIVATIONS[activation])
+            for kind, activation, w, b in zip(self.kinds, self.activations, weights, biases)
+        ]
+
+    @classmethod
+    def from_npz(cls, npz_path: str = NPZ_PATH) -> 'NumpyModel':
+        with np.load(npz_path, allow_pickle=False) as data:
+            version = int(data['format_version'])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported .npz format version {version}")
+            kinds = [str(k) for k in data['kinds']]
+            return cls(
+                kinds,
+                [str(a) for a in data['activations']],
+                [data[f'w{i}'] for i in range(len(kinds))],
+                [data[f'b{i}'] for i in range(len(kinds))],
+                str(data['source_sha256'])
+            )
+
+    def predict(self, x, verbose: int = 0) -> np.ndarray:
+        """Run the forward pass on an N x 90 batch."""
+        h = np.asarray(x, dtype=np.float32)
+        for kind, w, b, activation in self.layers:
+            if kind == 'dense':
+                h = activation(h @ w + b)
+            else:
+                h = h * w + b
+        return h
+
+    # ------------------------------------------------------------------------
+    # Shared memory (see predict_pool.py)
+    # ------------------------------------------------------------------------
+
+    def to_shared_memory(self):
+        """
+        Copy all weights into one SharedMemory block.
+
+        Returns:
+            (shm, layout): the block (caller owns and must unlink it) and a
+            picklable layout that attach_shared() uses to rebuild the model
+            as read-only views, so worker processes share a single copy.
+        """
+        from multiprocessing import shared_memory
+
+        arrays = []
+        for _, w, b, _ in self.layers:
+            arrays += [np.ascontiguousarray(w, dtype=np.float32), np.ascontiguousarray(b, dtype=np.float32)]
+        offsets = []
+        total = 0
+        for arr in arrays:
+            offsets.append(total)
+            total += -(-arr.nbytes // 64) * 64  # 64-byte aligned
+        shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        for arr, offset in zip(arrays, offsets):
+            np.ndarray(arr.shape, dtype=np.float32, buffer=shm.buf, offset=offset)[...] = arr
+        layout = {
+            "kinds": self.kinds,
+            "activations": self.activations,
+            "sourceSha256": self.source_sha256,
+            "arrays": [(offset, arr.shape) for arr, offset in zip(arrays, offsets)]
+        }
+        return shm, layout
+
+    @classmethod
+    def attach_shared(cls, name: str, layout: dict):
+        """
+        Rebuild a model from a block written by to_shared_memory().
+
+        Returns:
+            (shm, model): keep shm referenced for as long as model is used
+        """
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=name)
+        views = []
+        for offset, shape in layout["arrays"]:
+            view = np.ndarray(shape, dtype=np.float32, buffer=shm.buf, offset=offset)
+            view.flags.writeable = False
+            views.append(view)
+        model = cls(layout["kinds"], layout["activations"], views[0::2], views[1::2], layout["sourceSha256"])
+        return shm, model
+
+
+def load_numpy_model(npz_path: str = NPZ_PATH, h5_path: str = H5_PATH) -> NumpyModel:
+    """Load the exported model, warning if it was exported from a different .h5."""
+    model = NumpyModel.from_npz(npz_path)
+    try:
+        if file_sha256(h5_path) != model.source_sha256:
+            print(f"Warning: {npz_path} is stale; re-run 'numpy_model.py export'", file=sys.stderr)
+    except FileNotFoundError:
+        pass  # Slim deployments ship only the .npz
+    return model
+
+
+# ============================================================================
+# PARITY CHECK
+# ============================================================================
+
+def check_parity(samples: int = 2048, tolerance: float = 1e-5, seed: int = 0,
+                 h5_path: str = H5_PATH, npz_path: str = NPZ_PATH) -> float:
+    """
+    Compare NumPy and Keras outputs on random inputs.
+
+    Returns:
+        Maximum absolute difference across all outputs
+
+    Raises:
+        AssertionError: if the difference exceeds the tolerance
+    """
+    from tensorflow.keras.models import load_model
+
+    rng = np.random.default_rng(seed)
+    # Features are mostly 0-1 ratios and flags, with some small counts
+    x = rng.random((samples, 90), dtype=np.float32)
+    x[: samples // 4] *= 10
+
+    keras_out = load_model(h5_path, compile=False).predict(x, verbose=0)
+    numpy_out = NumpyModel.from_npz(npz_path).predict(x)
+    max_diff = float(np.max(np.abs(keras_out - numpy_out)))
+    if max_diff > tolerance:
+        raise AssertionError(f"max abs diff {max_diff:.3g} exceeds tolerance {tolerance:.3g}")
+    return max_diff
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export and verify the NumPy inference engine")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="Write the .npz from the Keras .h5 model")
+    export.add_argument("--h5", default=H5_PATH)
+    export.add_argument("--out", default=NPZ_PATH)
+
+    parity = sub.add_parser("check-parity", help="Compare NumPy and Keras outputs")
+    parity.add_argument("--h5", default=H5_PATH)
+    parity.add_argument("--npz", default=NPZ_PATH)
+    parity.add_argument("--samples", type=int, default=2048)
+    parity.add_argument("--tolerance", type=float, default=1e-5)
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "export":
+            n_layers = export_npz(args.h5, args.out)
+            print(json.dumps({"output": args.out, "layers": n_layers}))
+        else:
+            max_diff = check_parity(args.samples, args.tolerance, h5_path=args.h5, npz_path=args.npz)
+            print(json.dumps({"samples": args.samples, "maxAbsDiff": max_diff, "ok": True}))
+    except AssertionError as e:
+        print(json.dumps({"ok": False, "error": str(e)}))
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
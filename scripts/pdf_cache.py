@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache of pdf_parser.py results.
+
+Entries are keyed on the SHA-256 of the PDF bytes plus the parser version
+and extraction settings, so an identical upload is served from disk no
+matter what it is named, and any change to the parser or its tolerances
+misses cleanly. The cache directory is capped in total size; the least
+recently used entries (by mtime, refreshed on every hit) are evicted first.
+
+The total size is scanned from disk once, then tracked in memory on every
+put; the directory is only walked again when that total passes the cap.
+Eviction then trims to EVICT_TO of the cap, so a full cache doesn't rescan
+on every store. Other processes sharing the directory make the tracked
+total drift low, which each eviction scan corrects.
+
+This module deliberately imports nothing heavy: a hit never loads pdfplumber.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from typing import List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Eviction trims down to this fraction of max_bytes
+EVICT_TO = 0.9
+
+
+def sha256_file(path: str) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sha256_buffer(buf) -> str:
+    """Hex SHA-256 of an in-memory buffer (bytes, memoryview, mmap)."""
+    return hashlib.sha256(buf).hexdigest()
+
+
+class PdfCache:
+    """Size-capped LRU directory of {rawText, pages} payloads."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        # Bytes on disk as far as this process knows; scanned on the first put
+        self._total: Optional[int] = None
+
+    @staticmethod
+    def key(content_sha256: str, settings: str) -> str:
+        """Cache key for a document hash and a parser version/settings string."""
+        return hashlib.sha256(f"{content_sha256}|{settings}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached payload and mark it recently used, or None."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                payload = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or 'rawText' not in payload or 'pages' not in payload:
+            return None
+        return payload
+
+    def put(self, key: str, payload: dict) -> None:
+        """Store a payload, then evict old entries if over the size cap. Best-effort."""
+        path = self._path(key)
+        if self._total is None:
+            self._total = sum(size for _, size, _ in self._scan())
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"rawText": payload["rawText"], "pages": payload["pages"]}, f)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            self._total += os.path.getsize(path) - old_size
+        except OSError:
+            return
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        if self._total > self.max_bytes:
+            self.evict()
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every entry on disk."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                full = os.path.join(root, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full))
+        return entries
+
+    def evict(self) -> int:
+        """
+        If over max_bytes, delete least recently used entries until under
+        EVICT_TO of it. Resyncs the tracked total. Returns entries removed.
+        """
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        if total <= self.max_bytes:
+            self._total = total
+            return removed
+        target = int(self.max_bytes * EVICT_TO)
+        entries.sort()
+        for _, size, full in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(full)
+                removed += 1
+            except OSError:
+                pass
+            total -= size
+        self._total = total
+        return removed
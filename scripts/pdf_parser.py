@@ -7,6 +7,46 @@ PDF Resume Extractor
 
 CLI:
     python3 scripts/pdf_parser.py /tmp/resume.pdf
+    python3 scripts/pdf_parser.py /tmp/resume.pdf --workers 4 [--parallel-threshold 20]
+
+With --workers > 1, documents with at least --parallel-threshold pages are
+split into contiguous page ranges extracted by a process pool (each worker
+opens the PDF itself). Results are merged in page order before header/footer
+removal, so the output is byte-identical to the sequential path.
+
+Bulk ingestion (one NDJSON line per file, written as each file finishes):
+    python3 scripts/pdf_parser.py --batch /path/to/resumes/ --workers 8
+    python3 scripts/pdf_parser.py --batch 'uploads/**/*.pdf'
+    find uploads -name '*.pdf' | python3 scripts/pdf_parser.py --batch -
+
+Each line is {"source": path, "rawText", "pages", "error"}; a file that fails
+only sets its own "error".
+
+Pages are extracted and cleaned as a generator pipeline: each page's layout
+objects are released once its text is out, and header/footer noise is
+learned from the first HEADER_SAMPLE_PAGES pages only. --max-pages and
+--max-chars stop extraction early. --stream writes NDJSON as pages finish:
+    {"page": 0, "text": "..."} ... {"done": true, "pageCount": n, "error": null}
+
+PDF bytes can also come from stdin, so an upload never touches disk, or a
+file can be memory-mapped instead of read; both enforce --max-bytes
+(default 10MB) before anything is parsed:
+    cat resume.pdf | python3 scripts/pdf_parser.py - [--max-bytes 10485760]
+    python3 scripts/pdf_parser.py /tmp/resume.pdf --mmap
+
+Long-lived worker mode (pdfplumber is imported once, not per upload):
+    python3 scripts/pdf_parser.py --serve [--job-timeout 60 --max-jobs 200]
+    python3 scripts/pdf_parser.py --socket /tmp/pdf.sock [--workers 2]
+
+Each job is one JSON line, {"path": "...", "maxPages"?, "maxChars"?, "id"?},
+answered with the output schema below (plus "id"); {"op": "health"} reports
+worker counters. Jobs run in resident child processes (see pdf_worker.py):
+one that exceeds --job-timeout is killed and its worker restarted, and each
+worker is recycled after --max-jobs jobs.
+
+With --cache-dir (or $PDF_PARSER_CACHE_DIR), results are cached by the
+SHA-256 of the file bytes plus PARSER_VERSION and the extraction tolerances,
+capped at --cache-max-mb with LRU eviction. A hit skips importing pdfplumber.
 
 Outputs JSON to stdout:
 {
@@ -23,22 +63,44 @@ On error, prints:
 }
 """
 
+import os
 import sys
+import io
 import json
 import re
-from typing import List
+import time
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from pdf_cache import PdfCache, sha256_file, sha256_buffer, DEFAULT_MAX_BYTES
+from pdf_worker import DEFAULT_JOB_TIMEOUT_S, DEFAULT_MAX_JOBS
 
-try:
-    import pdfplumber  # type: ignore
-except Exception as e:
-    # If pdfplumber isn't installed, report error cleanly
-    err = {
-        "rawText": "",
-        "pages": [],
-        "error": f"pdfplumber import error: {e}"
-    }
-    print(json.dumps(err))
-    sys.exit(0)
+# Bump when extraction or cleanup changes the output, to invalidate cached results
+PARSER_VERSION = "3"
+
+# Imported on first extraction, so cache hits never pay for it
+pdfplumber = None
+
+
+class PdfplumberImportError(Exception):
+    pass
+
+
+def _load_pdfplumber():
+    global pdfplumber
+    if pdfplumber is None:
+        try:
+            import pdfplumber as module  # type: ignore
+        except Exception as e:
+            # If pdfplumber isn't installed, report error cleanly
+            raise PdfplumberImportError(f"pdfplumber import error: {e}")
+        pdfplumber = module
+    return pdfplumber
+
+
+# Compiled once; each is applied at most once per page (see normalize_text)
+_MULTI_SPACE_RE = re.compile(r"[ \u00A0]{2,}")
+_HYPHEN_BREAK_RE = re.compile(r"-\s*\n\s*")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 
 def normalize_text(text: str) -> str:
@@ -47,11 +109,13 @@ def normalize_text(text: str) -> str:
     # Collapse tabs to spaces
     text = text.replace('\t', ' ')
     # Collapse multiple spaces
-    text = re.sub(r"[ \u00A0]{2,}", " ", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
     # Fix hyphenated line breaks: inter-\nnational -> international
-    text = re.sub(r"-\s*\n\s*", "", text)
+    if '-' in text:
+        text = _HYPHEN_BREAK_RE.sub("", text)
     # Remove excessive blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if '\n\n\n' in text:
+        text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -59,7 +123,7 @@ def split_lines(text: str) -> List[str]:
     return [ln.strip() for ln in text.split('\n')]
 
 
-def remove_header_footer_candidates(pages_lines: List[List[str]]) -> List[List[str]]:
+def find_header_footer_noise(pages_lines: List[List[str]]) -> Set[str]:
     # Identify short lines that repeat across >= 50% of pages -> considered header/footer noise
     freq = {}
     n_pages = len(pages_lines)
@@ -75,59 +139,625 @@ def remove_header_footer_candidates(pages_lines: List[List[str]]) -> List[List[s
                     freq[s] = freq.get(s, 0) + 1
                     seen.add(s)
     threshold = max(1, n_pages // 2)  # appears on at least half the pages
-    noise = {k for k, v in freq.items() if v >= threshold}
+    return {k for k, v in freq.items() if v >= threshold}
 
+
+def remove_header_footer_candidates(pages_lines: List[List[str]]) -> List[List[str]]:
+    noise = find_header_footer_noise(pages_lines)
     cleaned = []
     for lines in pages_lines:
         cleaned.append([ln for ln in lines if ln.strip() not in noise])
     return cleaned
 
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        out = {"rawText": "", "pages": [], "error": "missing PDF path argument"}
-        print(json.dumps(out))
+# Extraction settings passed to page.extract_text
+X_TOLERANCE = 1.5
+Y_TOLERANCE = 2.0
+
+# Below this many pages, process-pool startup costs more than it saves
+DEFAULT_PARALLEL_THRESHOLD = 20
+
+# Header/footer noise is learned from at most this many leading pages, so
+# only that many pages are ever buffered; shorter documents use every page
+HEADER_SAMPLE_PAGES = 16
+
+# Largest PDF accepted on stdin or via --mmap (matches the upload routes'
+# DEFAULT_EXTRACTOR_CONFIG.maxFileSize)
+DEFAULT_MAX_INPUT_BYTES = 10 * 1024 * 1024
+
+# A filesystem path, or an open binary file-like object positioned at the PDF
+PdfSource = Union[str, BinaryIO]
+
+
+class PdfTooLargeError(ValueError):
+    pass
+
+
+def read_pdf_stream(stream: BinaryIO, max_bytes: int = DEFAULT_MAX_INPUT_BYTES) -> io.BytesIO:
+    """
+    Read a whole PDF from a binary stream (e.g. stdin) into memory.
+
+    At most max_bytes + 1 bytes are ever read, so an oversized upload is
+    rejected without buffering it. The returned BytesIO shares the bytes
+    read rather than copying them.
+    """
+    data = stream.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise PdfTooLargeError(f"PDF exceeds maximum size of {max_bytes} bytes")
+    return io.BytesIO(data)
+
+
+def open_pdf_mmap(pdf_path: str, max_bytes: int = DEFAULT_MAX_INPUT_BYTES) -> BinaryIO:
+    """
+    Map a PDF read-only instead of reading it; pages are faulted in as the
+    parser seeks. The size limit is checked before mapping. Close when done.
+    """
+    import mmap
+
+    with open(pdf_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > max_bytes:
+            raise PdfTooLargeError(f"PDF exceeds maximum size of {max_bytes} bytes")
+        if size == 0:
+            # mmap cannot map an empty file; let the parser report it
+            return io.BytesIO(b"")
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _source_sha256(pdf: PdfSource) -> str:
+    if isinstance(pdf, str):
+        return sha256_file(pdf)
+    if isinstance(pdf, io.BytesIO):
+        return sha256_buffer(pdf.getbuffer())
+    return sha256_buffer(pdf)
+
+
+def extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract raw text for pages [start, stop). Runs in pool workers."""
+    with _load_pdfplumber().open(pdf_path) as pdf:
+        texts = []
+        for i in range(start, stop):
+            page = pdf.pages[i]
+            texts.append(page.extract_text(x_tolerance=X_TOLERANCE, y_tolerance=Y_TOLERANCE) or "")
+            page.close()
+        return texts
+
+
+def iter_raw_pages(pdf_path: PdfSource, workers: int = 1,
+                   parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+                   max_pages: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield raw text for each page, in page order.
+
+    Each page's cached layout objects are released as soon as its text is
+    extracted, so memory does not grow with page count. Closing the
+    generator early stops extraction.
+
+    Args:
+        workers: Max worker processes; 1 keeps everything in this process.
+            Ignored for file-like sources, since workers reopen the path
+        parallel_threshold: Documents with fewer pages are always extracted
+            sequentially
+        max_pages: Stop after this many pages
+    """
+    with _load_pdfplumber().open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+        if max_pages is not None:
+            n_pages = min(n_pages, max_pages)
+        if workers <= 1 or n_pages < parallel_threshold or not isinstance(pdf_path, str):
+            for page in pdf.pages[:n_pages]:
+                text = page.extract_text(x_tolerance=X_TOLERANCE, y_tolerance=Y_TOLERANCE) or ""
+                page.close()
+                yield text
+            return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers, n_pages)
+    # Two contiguous ranges per worker evens out pages of uneven cost
+    n_ranges = min(n_pages, workers * 2)
+    bounds = [round(i * n_pages / n_ranges) for i in range(n_ranges + 1)]
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for chunk in pool.map(extract_page_range, [pdf_path] * n_ranges, bounds[:-1], bounds[1:]):
+            yield from chunk
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def clean_page_lines(lines: List[str], noise: Set[str]) -> str:
+    """
+    Join one normalized page's lines back together without the noise lines.
+
+    Equivalent to normalize_text() on the joined lines, without rescanning:
+    the lines are already normalized and stripped, so dropping noise can only
+    leave runs of blank lines (kept as one) and blank edges (dropped).
+    """
+    kept: List[str] = []
+    for ln in lines:
+        if ln:
+            if ln not in noise:
+                kept.append(ln)
+        elif kept and kept[-1]:
+            kept.append(ln)
+    if kept and not kept[-1]:
+        kept.pop()
+    return "\n".join(kept)
+
+
+def join_pages(pages: List[str]) -> str:
+    """
+    Join cleaned pages with blank lines into the document's rawText.
+
+    Equivalent to normalize_text("\\n\\n".join(pages)) for pages produced by
+    clean_page_lines(): empty pages vanish, and a trailing hyphen is dropped
+    whenever another page follows, joining the two pages directly.
+    """
+    parts: List[str] = []
+    glue = False
+    for page in pages:
+        if not glue and parts and parts[-1].endswith('-'):
+            # Any following page break swallows the hyphen; the next
+            # non-empty page is appended to this one
+            parts[-1] = parts[-1][:-1]
+            glue = True
+        if not page:
+            continue
+        if glue:
+            parts[-1] += page
+            glue = False
+        else:
+            parts.append(page)
+    # A swallowed hyphen on the last page can leave its preceding newline behind
+    return "\n\n".join(p for p in parts if p).strip()
+
+
+def iter_clean_pages(raw_pages: Iterable[str], max_chars: Optional[int] = None,
+                     sample_pages: int = HEADER_SAMPLE_PAGES) -> Iterator[str]:
+    """
+    Normalize pages and strip header/footer noise, yielding each cleaned page.
+
+    Noise lines are learned from the first sample_pages pages (buffered),
+    then every page is cleaned against that set as it arrives.
+
+    Args:
+        max_chars: Stop after the page that brings the normalized text to
+            this many characters
+    """
+    raw_pages = iter(raw_pages)
+    sample: List[List[str]] = []
+    n_chars = 0
+    stopped = False
+    for txt in raw_pages:
+        # Normalize per page to stabilize content before noise detection
+        txt_norm = normalize_text(txt)
+        n_chars += len(txt_norm)
+        sample.append(split_lines(txt_norm))
+        if max_chars is not None and n_chars >= max_chars:
+            stopped = True
+            break
+        if len(sample) >= sample_pages:
+            break
+
+    # Remove obvious header/footer across pages (short repeated lines)
+    noise = find_header_footer_noise(sample)
+
+    def clean(lines: List[str]) -> str:
+        return clean_page_lines(lines, noise)
+
+    for lines in sample:
+        yield clean(lines)
+    sample.clear()
+    if stopped:
         return
 
-    pdf_path = sys.argv[1]
+    for txt in raw_pages:
+        txt_norm = normalize_text(txt)
+        n_chars += len(txt_norm)
+        yield clean(split_lines(txt_norm))
+        if max_chars is not None and n_chars >= max_chars:
+            return
+
+
+def extraction_settings(max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+    """Parser version and extraction settings that affect the output (cache key material)."""
+    return (f"v{PARSER_VERSION}|x_tolerance={X_TOLERANCE}|y_tolerance={Y_TOLERANCE}"
+            f"|max_pages={max_pages}|max_chars={max_chars}")
+
+
+def parse_pdf(pdf_path: PdfSource, workers: int = 1,
+              parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+              cache: Optional[PdfCache] = None, max_pages: Optional[int] = None,
+              max_chars: Optional[int] = None) -> dict:
+    """
+    Extract and clean a PDF into the {rawText, pages, error} output schema. Never raises.
+
+    pdf_path may also be an open binary file-like object, such as the
+    result of read_pdf_stream() or open_pdf_mmap(). With a cache, the file is hashed first and a hit is returned without
+    importing pdfplumber; successful results are stored for next time.
+    """
+    if cache is None:
+        return _parse_pdf(pdf_path, workers, parallel_threshold, max_pages, max_chars)
     try:
-        pages_text: List[str] = []
-        pages_lines: List[List[str]] = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                # Extract text; keep line structure
-                txt = page.extract_text(x_tolerance=1.5, y_tolerance=2.0) or ""
-                # Normalize per page to stabilize content before noise detection
-                txt_norm = normalize_text(txt)
-                lines = split_lines(txt_norm)
-                pages_text.append(txt_norm)
-                pages_lines.append(lines)
-
-        # Remove obvious header/footer across pages (short repeated lines)
-        cleaned_pages_lines = remove_header_footer_candidates(pages_lines)
-        cleaned_pages_text: List[str] = []
-        for lines in cleaned_pages_lines:
-            # preserve bullets and structure; join lines with \n
-            page_text = "\n".join(lines)
-            # after removal, run a light normalization again to keep tidy
-            page_text = normalize_text(page_text)
-            cleaned_pages_text.append(page_text)
-
-        raw_text = normalize_text("\n\n".join(cleaned_pages_text))
-        out = {
+        key = PdfCache.key(_source_sha256(pdf_path), extraction_settings(max_pages, max_chars))
+    except OSError as e:
+        return {"rawText": "", "pages": [], "error": f"{type(e).__name__}: {e}"}
+    cached = cache.get(key)
+    if cached is not None:
+        return {"rawText": cached["rawText"], "pages": cached["pages"], "error": None}
+    out = _parse_pdf(pdf_path, workers, parallel_threshold, max_pages, max_chars)
+    if out["error"] is None:
+        cache.put(key, out)
+    return out
+
+
+def _parse_pdf(pdf_path: PdfSource, workers: int, parallel_threshold: int,
+               max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> dict:
+    try:
+        raw_pages = iter_raw_pages(pdf_path, workers, parallel_threshold, max_pages)
+        cleaned_pages_text = list(iter_clean_pages(raw_pages, max_chars))
+        raw_pages.close()
+
+        raw_text = join_pages(cleaned_pages_text)
+        return {
             "rawText": raw_text,
             "pages": cleaned_pages_text,
             "error": None
         }
-        print(json.dumps(out))
+    except PdfplumberImportError as e:
+        return {"rawText": "", "pages": [], "error": str(e)}
     except Exception as e:
-        err = {
+        return {
             "rawText": "",
             "pages": [],
             "error": f"{type(e).__name__}: {e}"
         }
-        print(json.dumps(err))
 
 
+def stream_pdf(pdf_path: PdfSource, out, workers: int = 1,
+               parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+               max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> None:
+    """
+    Write one NDJSON record per cleaned page as soon as it is ready:
+        {"page": 0, "text": "..."} ... then {"done": true, "pageCount": n, "error": null}
+
+    Nothing is accumulated, so memory stays bounded by the header sample.
+    rawText is not repeated; it is the pages joined with blank lines.
+    """
+    n_pages = 0
+    error = None
+    raw_pages = None
+    try:
+        raw_pages = iter_raw_pages(pdf_path, workers, parallel_threshold, max_pages)
+        for text in iter_clean_pages(raw_pages, max_chars):
+            out.write(json.dumps({"page": n_pages, "text": text}) + "\n")
+            out.flush()
+            n_pages += 1
+    except PdfplumberImportError as e:
+        error = str(e)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        if raw_pages is not None:
+            raw_pages.close()
+    out.write(json.dumps({"done": True, "pageCount": n_pages, "error": error}) + "\n")
+    out.flush()
+
+
+# ============================================================================
+# LONG-LIVED WORKER MODE
+# ============================================================================
+
+def _job_error(message: str) -> dict:
+    return {"rawText": "", "pages": [], "error": message}
+
+
+def _optional_int(job: dict, field: str) -> Optional[int]:
+    value = job.get(field)
+    if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+        raise ValueError(f"'{field}' must be a positive integer")
+    return value
+
+
+def handle_job(line: str, pool, started_at: float) -> dict:
+    """
+    Answer one JSON-line job. Never raises.
+
+        {"path": "/tmp/resume.pdf", "maxPages": 5, "maxChars": 20000, "id": 7}
+            -> {"rawText", "pages", "error"} (plus "id" when given)
+        {"op": "health"} -> {"status": "ok", "pid", "uptime", "pool": {...}}
+    """
+    try:
+        job = json.loads(line)
+    except json.JSONDecodeError as e:
+        return _job_error(f"Invalid JSON input: {e}")
+    if not isinstance(job, dict):
+        return _job_error("Job must be a JSON object")
+    if job.get('op') == 'health':
+        return {"status": "ok", "pid": os.getpid(),
+                "uptime": round(time.monotonic() - started_at, 3), "pool": pool.stats()}
+    if job.get('op') is not None:
+        return _job_error(f"Unknown op '{job['op']}'")
+
+    path = job.get('path')
+    try:
+        if not isinstance(path, str) or not path:
+            raise ValueError("Job needs a 'path' string")
+        max_pages = _optional_int(job, 'maxPages')
+        max_chars = _optional_int(job, 'maxChars')
+        out = pool.extract(path, max_pages=max_pages, max_chars=max_chars)
+    except ValueError as e:
+        out = _job_error(str(e))
+    except Exception as e:
+        out = _job_error(f"{type(e).__name__}: {e}")
+    if 'id' in job:
+        out = {"id": job['id'], **out}
+    return out
+
+
+def serve_stdio(pool) -> None:
+    """Answer JSON-line jobs on stdin, one at a time, until EOF."""
+    started_at = time.monotonic()
+    print(json.dumps(handle_job('{"op": "health"}', pool, started_at)), flush=True)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        sys.stdout.write(json.dumps(handle_job(line, pool, started_at)) + "\n")
+        sys.stdout.flush()
+
+
+def serve_socket(socket_path: str, pool) -> None:
+    """
+    Answer JSON-line jobs on a local Unix socket.
+
+    Each connection gets its own thread; jobs run on the pool's slots, so up
+    to its worker count run at once and the rest wait for a free slot.
+    SIGTERM stops accepting connections and lets running jobs finish.
+    """
+    import signal
+    import threading
+    import socketserver
+
+    started_at = time.monotonic()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode('utf-8', errors='replace')
+                if not line.strip():
+                    continue
+                self.wfile.write((json.dumps(handle_job(line, pool, started_at)) + "\n").encode('utf-8'))
+                self.wfile.flush()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = Server(socket_path, Handler)
+
+    def stop(*_):
+        # serve_forever() must be stopped from another thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ============================================================================
+# BULK INGESTION
+# ============================================================================
+
+def iter_batch_paths(source: str) -> Iterator[str]:
+    """
+    Yield PDF paths from a directory (recursive), a glob pattern, or '-'
+    for newline-delimited paths on stdin. Stdin and directories are read
+    lazily, one directory level at a time; glob matches are collected and
+    sorted first so the output order is stable.
+    """
+    if source == '-':
+        for line in sys.stdin:
+            path = line.strip()
+            if path:
+                yield path
+    elif os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith('.pdf'):
+                    yield os.path.join(root, name)
+    else:
+        import glob
+        yield from sorted(glob.iglob(source, recursive=True))
+
+
+def _batch_record(path: str, out: dict) -> str:
+    return json.dumps({"source": path, **out})
+
+
+def _parse_isolated(path: str, cache: Optional[PdfCache] = None, **limits) -> dict:
+    """Parse one file in its own single-use process, so a crash only affects it."""
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(parse_pdf, path, cache=cache, **limits).result()
+        except BrokenProcessPool:
+            return {"rawText": "", "pages": [], "error": "worker process crashed"}
+
+
+def run_batch(paths: Iterable[str], workers: int, out=None,
+              cache: Optional[PdfCache] = None, max_pages: Optional[int] = None,
+              max_chars: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Parse many PDFs with a bounded process pool, writing one NDJSON line per
+    file ({source, rawText, pages, error}) as soon as it finishes.
+
+    At most 2 x workers files are queued at once, so memory stays flat on
+    long path lists. If a worker process dies (e.g. a PDF crashes the native
+    parser), every file that was in flight is re-run in isolation so only
+    the culprit reports an error, and the batch continues in a fresh pool.
+
+    Returns:
+        (files processed, files with an error)
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    from concurrent.futures.process import BrokenProcessPool
+
+    out = out or sys.stdout
+    limits = {"max_pages": max_pages, "max_chars": max_chars}
+    max_pending = workers * 2
+    paths = iter(paths)
+    pending = {}
+    processed = errors = 0
+
+    def emit(path: str, result: dict) -> None:
+        nonlocal processed, errors
+        processed += 1
+        if result.get("error"):
+            errors += 1
+        out.write(_batch_record(path, result) + "\n")
+        out.flush()
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            for path in paths:
+                pending[pool.submit(parse_pdf, path, cache=cache, **limits)] = path
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            crashed = []
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    emit(path, future.result())
+                except BrokenProcessPool:
+                    crashed.append(path)
+            if crashed:
+                # The whole pool is gone; nothing still pending will complete
+                crashed += pending.values()
+                pending.clear()
+                pool.shutdown(wait=True, cancel_futures=True)
+                for path in crashed:
+                    emit(path, _parse_isolated(path, cache, **limits))
+                pool = ProcessPoolExecutor(max_workers=workers)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return processed, errors
+
+
+def main() -> None:
+    import argparse
+
+    def positive_int(value: str) -> int:
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+        return number
+
+    parser = argparse.ArgumentParser(description="Extract resume text from a PDF as JSON")
+    parser.add_argument("pdf_path", nargs="?", help="Path to the PDF file, or '-' to read PDF bytes from stdin")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Extract pages (or, with --batch, files) with this many processes (0 = one per CPU)")
+    parser.add_argument("--parallel-threshold", type=int, default=DEFAULT_PARALLEL_THRESHOLD,
+                        help="Minimum page count before --workers takes effect")
+    parser.add_argument("--batch", metavar="SOURCE",
+                        help="Parse every PDF in a directory, a glob, or '-' (paths on stdin) to NDJSON")
+    parser.add_argument("--cache-dir", default=os.environ.get("PDF_PARSER_CACHE_DIR"),
+                        help="Reuse results for identical PDF bytes from this directory "
+                             "(default: $PDF_PARSER_CACHE_DIR; unset disables caching)")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Evict least recently used cache entries above this total size")
+    parser.add_argument("--max-pages", type=positive_int, help="Extract at most this many pages")
+    parser.add_argument("--max-chars", type=positive_int,
+                        help="Stop after the page that brings the text to this many characters")
+    parser.add_argument("--stream", action="store_true",
+                        help="Emit one NDJSON record per page as it is extracted (single file only)")
+    parser.add_argument("--mmap", action="store_true",
+                        help="Memory-map the PDF instead of reading it through buffered file I/O")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_INPUT_BYTES,
+                        help="Reject PDFs larger than this with stdin ('-') or --mmap input")
+    parser.add_argument("--serve", action="store_true",
+                        help="Stay resident and answer JSON-line jobs on stdin/stdout")
+    parser.add_argument("--socket", metavar="PATH",
+                        help="Stay resident and answer JSON-line jobs on this Unix socket")
+    parser.add_argument("--job-timeout", type=float, default=DEFAULT_JOB_TIMEOUT_S,
+                        help="Kill and restart a worker whose job runs longer than this (seconds)")
+    parser.add_argument("--max-jobs", type=int, default=DEFAULT_MAX_JOBS,
+                        help="Recycle each worker process after this many jobs")
+    args = parser.parse_args()
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    cache = None
+    if args.cache_dir:
+        try:
+            cache = PdfCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+        except OSError as e:
+            print(f"Warning: cache disabled: {e}", file=sys.stderr)
+
+    if args.serve or args.socket:
+        from pdf_worker import PdfWorkerPool
+
+        try:
+            pool = PdfWorkerPool(workers, args.job_timeout, args.max_jobs, args.cache_dir,
+                                 int(args.cache_max_mb * 1024 * 1024))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            if args.socket:
+                serve_socket(args.socket, pool)
+            else:
+                serve_stdio(pool)
+        finally:
+            pool.close()
+        return
+
+    if args.batch:
+        processed, errors = run_batch(iter_batch_paths(args.batch), workers, cache=cache,
+                                      max_pages=args.max_pages, max_chars=args.max_chars)
+        print(f"Processed {processed} files ({errors} with errors)", file=sys.stderr)
+        return
+
+    if not args.pdf_path:
+        out = {"rawText": "", "pages": [], "error": "missing PDF path argument"}
+        print(json.dumps(out))
+        return
+
+    source: PdfSource = args.pdf_path
+    try:
+        if args.pdf_path == '-':
+            source = read_pdf_stream(sys.stdin.buffer, args.max_bytes)
+        elif args.mmap:
+            source = open_pdf_mmap(args.pdf_path, args.max_bytes)
+    except (PdfTooLargeError, OSError) as e:
+        message = str(e) if isinstance(e, PdfTooLargeError) else f"{type(e).__name__}: {e}"
+        print(json.dumps({"rawText": "", "pages": [], "error": message}))
+        return
+
+    try:
+        if args.stream:
+            stream_pdf(source, sys.stdout, workers, args.parallel_threshold,
+                       args.max_pages, args.max_chars)
+        else:
+            print(json.dumps(parse_pdf(source, workers, args.parallel_threshold, cache,
+                                       args.max_pages, args.max_chars)))
+    finally:
+        if not isinstance(source, str):
+            source.close()
+
 if __name__ == "__main__":
     main()
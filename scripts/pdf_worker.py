@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Resident extraction processes for pdf_parser.py's long-lived modes.
+
+Each slot is one child process that has pdfplumber (and pdfminer) imported
+already: children are forked from a forkserver that preloads them, so a
+job never pays interpreter or import startup. A job that runs past its
+timeout is killed with its process and the slot is restarted, so a
+pathological PDF costs one error response instead of a wedged worker. A
+slot is also recycled after max_jobs jobs, which bounds memory growth from
+pdfminer's per-process caches.
+
+Used by `pdf_parser.py --serve` and `pdf_parser.py --socket PATH`.
+"""
+
+import sys
+import time
+import queue
+import threading
+import multiprocessing
+from typing import List, Optional
+
+# A job still running after this many seconds is killed
+DEFAULT_JOB_TIMEOUT_S = 60.0
+# Restart a slot's process after this many jobs
+DEFAULT_MAX_JOBS = 200
+
+
+def _worker_main(conn, cache_dir: Optional[str], cache_max_bytes: int) -> None:
+    """Child process: answer (path, limits) messages until told to stop."""
+    import signal
+    from pdf_parser import parse_pdf, _load_pdfplumber, PdfplumberImportError
+    from pdf_cache import PdfCache
+
+    # The supervisor owns shutdown; don't die mid-job on the terminal's Ctrl-C
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        _load_pdfplumber()
+    except PdfplumberImportError:
+        pass  # reported per job by parse_pdf
+    cache = None
+    if cache_dir:
+        try:
+            cache = PdfCache(cache_dir, cache_max_bytes)
+        except OSError:
+            pass
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        if msg is None:
+            break
+        path, limits = msg
+        conn.send(parse_pdf(path, cache=cache, **limits))
+
+
+class _Slot:
+    """One extraction process and its job count."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.jobs = 0
+
+
+class PdfWorkerPool:
+    """Run extraction jobs on resident child processes, one job per slot at a time."""
+
+    def __init__(self, workers: int = 1, job_timeout: float = DEFAULT_JOB_TIMEOUT_S,
+                 max_jobs: int = DEFAULT_MAX_JOBS, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = 0):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be >= 1")
+        # forkserver children fork from a process with pdfplumber imported; fall back to spawn
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        if 'forkserver' in methods:
+            self._ctx.set_forkserver_preload(['pdf_parser', 'pdf_cache', 'pdfplumber'])
+        self.job_timeout = job_timeout
+        self.max_jobs = max_jobs
+        self._cache_args = (cache_dir, cache_max_bytes)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.completed = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.recycles = 0
+        self._slots = [_Slot(i) for i in range(workers)]
+        self._idle: "queue.Queue[_Slot]" = queue.Queue()
+        for slot in self._slots:
+            self._start(slot)
+            self._idle.put(slot)
+
+    def _start(self, slot: _Slot) -> None:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn, *self._cache_args),
+            name=f"pdf-worker-{slot.index}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        slot.process, slot.conn, slot.jobs = process, parent_conn, 0
+
+    def _stop(self, slot: _Slot, kill: bool = False) -> None:
+        if not kill:
+            try:
+                slot.conn.send(None)
+            except (OSError, ValueError):
+                kill = True
+        if not kill:
+            slot.process.join(timeout=5.0)
+        if slot.process.is_alive():
+            slot.process.kill()
+            slot.process.join()
+        slot.conn.close()
+
+    def extract(self, pdf_path: str, max_pages: Optional[int] = None,
+                max_chars: Optional[int] = None) -> dict:
+        """
+        Parse one PDF on an idle slot, waiting for one if all are busy.
+
+        Returns the {rawText, pages, error} schema; a timeout or a crashed
+        child becomes an error result and the slot is restarted.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PDF worker pool is shutting down")
+        slot = self._idle.get()
+        try:
+            return self._run(slot, pdf_path, {"max_pages": max_pages, "max_chars": max_chars})
+        finally:
+            self._idle.put(slot)
+
+    def _run(self, slot: _Slot, pdf_path: str, limits: dict) -> dict:
+        error = None
+        timed_out = False
+        try:
+            slot.conn.send((pdf_path, limits))
+            if slot.conn.poll(self.job_timeout):
+                result = slot.conn.recv()
+            else:
+                timed_out = True
+                error = f"extraction timed out after {self.job_timeout:g}s"
+        except (EOFError, OSError):
+            error = "worker process crashed"
+
+        if error is not None:
+            with self._lock:
+                if timed_out:
+                    self.timeouts += 1
+                else:
+                    self.crashes += 1
+            print(f"pdf worker {slot.index}: {error}: {pdf_path}; restarting", file=sys.stderr)
+            self._stop(slot, kill=True)
+            if not self._closed:
+                self._start(slot)
+            return {"rawText": "", "pages": [], "error": error}
+
+        slot.jobs += 1
+        with self._lock:
+            self.completed += 1
+        if slot.jobs >= self.max_jobs and not self._closed:
+            with self._lock:
+                self.recycles += 1
+            self._stop(slot)
+            self._start(slot)
+        return result
+
+    def stats(self) -> dict:
+        """Slot and job counters for the health probe."""
+        with self._lock:
+            return {
+                "workers": len(self._slots),
+                "idle": self._idle.qsize(),
+                "pids": [slot.process.pid for slot in self._slots],
+                "jobTimeoutS": self.job_timeout,
+                "maxJobs": self.max_jobs,
+                "completed": self.completed,
+                "timeouts": self.timeouts,
+                "crashes": self.crashes,
+                "recycles": self.recycles
+            }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop taking jobs, wait for running ones (up to timeout), then stop the slots."""
+        with self._lock:
+            self._closed = True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stopped: List[_Slot] = []
+        while len(stopped) < len(self._slots):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                stopped.append(self._idle.get(timeout=remaining))
+            except queue.Empty:
+                break
+        for slot in self._slots:
+            self._stop(slot, kill=slot not in stopped)
@@ -2,89 +2,730 @@
 """
 Inference script for job matching model.
 Loads trained model and predicts readiness scores for resume-job pairs.
+
+CLI:
+    python3 scripts/predict.py '{"features": [90 numbers]}'
+
+Long-lived modes (model is loaded once and reused for every request):
+    python3 scripts/predict.py --serve                 # JSON lines on stdin/stdout
+    python3 scripts/predict.py --socket /tmp/predict.sock [--batch-window-ms 2 --max-batch-size 64]
+
+In socket mode, requests from concurrent connections that arrive within the
+batch window are answered by one batched forward pass. Add --workers N
+(with --backend numpy) to spread requests over N processes that share one
+read-only copy of the weights (see predict_pool.py).
+
+Bulk mode (one vectorized forward pass per chunk, results in input order):
+    python3 scripts/predict.py --batch requests.ndjson [--chunk-size 1024]
+    python3 scripts/predict.py --batch features.npy
+    cat requests.ndjson | python3 scripts/predict.py --batch -
+
+Top-K ranking of one resume against many jobs (see handle_rank for the schema):
+    python3 scripts/predict.py --rank request.json [--top-k 10]
+
+Any mode accepts --backend numpy to run the exported .npz model without
+importing TensorFlow (export it with scripts/numpy_model.py export).
+
+Predictions are cached by (model file hash, rounded feature vector): an
+in-memory LRU in long-lived modes (--cache-size) and, with --cache-dir, an
+on-disk store that also serves one-shot CLI calls (capped by
+--cache-dir-max-entries). --cache-stats reports hit/miss counters on
+stderr; the health probe includes them too.
+
+Each request is one JSON object per line:
+    {"features": [90 numbers]}  -> {"readiness", "matched", "missing", "weeks"}
+    {"op": "health"}            -> {"status": "ok", "ready": true, ...}
+    {"op": "metrics"}           -> {"format": "prometheus", "text": "..."}
+    {"op": "rank", "resume": [50], "jobs": [[40], ...], "k": 10}
+                                -> {"total", "results": [top-K by readiness]}
+Malformed requests get {"error": "message"} and the server keeps running.
 """
 
+import os
 import sys
 import json
+import time
+import threading
+
+from stage_metrics import StageMetrics, interpreter_startup_seconds
+
+# Per-stage timings and memory marks (see --timings and {"op": "metrics"})
+metrics = StageMetrics()
+_interpreter_seconds = interpreter_startup_seconds()
+if _interpreter_seconds is not None:
+    metrics.observe('interpreter', _interpreter_seconds)
+_module_started = time.perf_counter()
+
 import numpy as np
-from tensorflow.keras.models import load_model
+
+from numpy_model import file_sha256, load_numpy_model
+from prediction_cache import PredictionCache, DEFAULT_MAX_ENTRIES, DEFAULT_DECIMALS, DEFAULT_DISK_MAX_ENTRIES
+from micro_batcher import MicroBatcher, DEFAULT_WINDOW_MS, DEFAULT_MAX_BATCH
+
+metrics.observe('imports', time.perf_counter() - _module_started)
+metrics.mark_memory('imports')
 
 # Path to model file
 MODEL_PATH = 'models/intelligent_model.h5'
+# TensorFlow-free export of the same model (see numpy_model.py)
+NUMPY_MODEL_PATH = 'models/intelligent_model.npz'
+
+BACKENDS = ('keras', 'numpy')
+
+# Model loaded by long-lived modes; reused across requests
+_model = None
+_backend = 'keras'
+_model_lock = threading.Lock()
+# Serializes model.predict across socket connection threads
+_predict_lock = threading.Lock()
+# Optional prediction cache (see configure_cache)
+_cache = None
+# Scheduler for concurrent socket clients: MicroBatcher or WorkerPool (see serve_socket)
+_scheduler = None
+
+def load_trained_model(backend: str = 'keras'):
+    """
+    Load the trained model.
 
-def load_trained_model():
-    """Load the trained Keras model."""
+    Args:
+        backend: 'keras' loads the .h5 with TensorFlow; 'numpy' loads the
+            exported .npz and never imports TensorFlow
+    """
+    path = NUMPY_MODEL_PATH if backend == 'numpy' else MODEL_PATH
     try:
-        model = load_model(MODEL_PATH)
+        if backend == 'numpy':
+            with metrics.stage('model_load'):
+                model = load_numpy_model(NUMPY_MODEL_PATH, MODEL_PATH)
+            metrics.mark_memory('model_load')
+            return model
+
+        with metrics.stage('framework_import'):
+            from tensorflow.keras.models import load_model
+        metrics.mark_memory('framework_import')
+        with metrics.stage('model_load'):
+            model = load_model(MODEL_PATH, compile=False)
+        metrics.mark_memory('model_load')
         return model
     except FileNotFoundError:
-        print(f"Error: Model file not found at {MODEL_PATH}", file=sys.stderr)
+        print(f"Error: Model file not found at {path}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Error loading model: {e}", file=sys.stderr)
         sys.exit(1)
 
-def predict(features: list) -> list:
+def set_backend(backend: str) -> None:
+    """Select the inference backend used by get_model()."""
+    global _backend, _model
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    with _model_lock:
+        if backend != _backend:
+            _backend = backend
+            _model = None
+
+def get_model():
+    """Return the process-wide model, loading it on first use."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = load_trained_model(_backend)
+        return _model
+
+def model_file_path() -> str:
+    """Path of the model file the selected backend loads."""
+    return NUMPY_MODEL_PATH if _backend == 'numpy' else MODEL_PATH
+
+def configure_cache(max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: str = None,
+                    decimals: int = DEFAULT_DECIMALS, disk_max_entries: int = DEFAULT_DISK_MAX_ENTRIES):
+    """
+    Enable the prediction cache for the selected backend's model file.
+
+    Entries are keyed on the model file's content hash, so retraining (or
+    re-exporting) the model invalidates them. Returns None (cache disabled)
+    when neither tier is enabled.
+    """
+    global _cache
+    if max_entries <= 0 and not disk_dir:
+        _cache = None
+        return None
+    try:
+        model_hash = file_sha256(model_file_path())
+    except FileNotFoundError:
+        print(f"Error: Model file not found at {model_file_path()}", file=sys.stderr)
+        sys.exit(1)
+    _cache = PredictionCache(model_hash, max_entries=max_entries, disk_dir=disk_dir, decimals=decimals,
+                             disk_max_entries=disk_max_entries)
+    return _cache
+
+def clamp_predictions(raw: np.ndarray) -> np.ndarray:
+    """
+    Clamp raw model outputs to reasonable ranges.
+
+    Args:
+        raw: N x 4 array of model outputs
+
+    Returns:
+        N x 4 float array: readiness in [0, 1]; counts and weeks truncated
+        toward zero like int() and floored at 0
+    """
+    out = np.empty(raw.shape, dtype=np.float64)
+    out[:, 0] = np.clip(raw[:, 0], 0, 1)  # 0-1
+    out[:, 1:] = np.maximum(0, np.trunc(raw[:, 1:]))  # >= 0
+    return out
+
+def to_prediction_list(row: np.ndarray) -> list:
+    """Convert one clamped row to [readiness, matched, missing, weeks]."""
+    return [float(row[0]), int(row[1]), int(row[2]), int(row[3])]
+
+def predict_batch(features_matrix, model=None) -> np.ndarray:
+    """
+    Predict readiness and metrics for many feature vectors in one forward pass.
+
+    Args:
+        features_matrix: N x 90 array-like of numerical features
+        model: Loaded model to use (defaults to the process-wide model)
+
+    Returns:
+        N x 4 array of clamped predictions (see clamp_predictions)
+    """
+    features_array = np.asarray(features_matrix, dtype=np.float32)
+    if features_array.ndim != 2 or features_array.shape[1] != 90:
+        raise ValueError(f"Expected N x 90 features, got shape {features_array.shape}")
+    if features_array.shape[0] == 0:
+        return np.empty((0, 4), dtype=np.float64)
+
+    # The cache is keyed on the process-wide model, so skip it for explicit models
+    cache = _cache if model is None else None
+    if cache is None:
+        return _forward(features_array, model)
+
+    out = np.empty((features_array.shape[0], 4), dtype=np.float64)
+    # Misses grouped by key, so duplicate rows in one batch are computed once
+    todo = {}
+    with metrics.stage('cache_lookup'):
+        keys = cache.keys_for(features_array)
+        for i, key in enumerate(keys):
+            if key in todo:
+                todo[key].append(i)
+                continue
+            row = cache.get(key)
+            if row is None:
+                todo[key] = [i]
+            else:
+                out[i] = row
+    if todo:
+        computed = _forward(features_array[[rows[0] for rows in todo.values()]], model)
+        for (key, rows), row in zip(todo.items(), computed):
+            out[rows] = row
+            cache.put(key, row)
+    return out
+
+def _forward(features_array: np.ndarray, model=None) -> np.ndarray:
+    """One model.predict call plus clamping."""
+    if model is None:
+        model = get_model()
+    with metrics.stage('predict'):
+        predictions = model.predict(features_array, verbose=0)
+
+    return clamp_predictions(np.asarray(predictions, dtype=np.float64))
+
+def predict(features: list, model=None) -> list:
     """
     Predict readiness score and other metrics for given features.
-    
+
     Args:
         features: List of 90 numerical features
-        
+        model: Loaded model to use (defaults to the process-wide model)
+
     Returns:
         List of 4 predictions: [readiness (0-1), matched_count, missing_count, weeks]
     """
-    if len(features) != 90:
-        raise ValueError(f"Expected 90 features, got {len(features)}")
-    
-    # Convert to numpy array and reshape for model
-    features_array = np.array([features], dtype=np.float32)
-    
-    # Make prediction
-    model = load_trained_model()
-    predictions = model.predict(features_array, verbose=0)
-    
-    # Extract predictions (model has 4 outputs)
-    readiness = float(predictions[0][0])  # 0-1 score
-    matched_count = float(predictions[0][1])  # Matched skills count
-    missing_count = float(predictions[0][2])  # Missing skills count
-    weeks_to_learn = float(predictions[0][3])  # Weeks to learn missing skills
-    
-    # Clamp values to reasonable ranges
-    readiness = max(0, min(1, readiness))  # 0-1
-    matched_count = max(0, int(matched_count))  # >= 0
-    missing_count = max(0, int(missing_count))  # >= 0
-    weeks_to_learn = max(0, int(weeks_to_learn))  # >= 0
-    
-    return [readiness, matched_count, missing_count, weeks_to_learn]
+    row = feature_row(features)
+    return to_prediction_list(predict_batch(row[None], model=model)[0])
+
+def format_result(predictions: list) -> dict:
+    """Map the 4 model outputs to the JSON response schema."""
+    return {
+        "readiness": predictions[0],
+        "matched": predictions[1],
+        "missing": predictions[2],
+        "weeks": predictions[3]
+    }
+
+def parse_features(input_data) -> list:
+    """Validate a request object and return its feature list."""
+    if not isinstance(input_data, dict):
+        raise ValueError("Request must be a JSON object")
+    features = input_data.get('features', [])
+    if not isinstance(features, list):
+        raise ValueError("'features' must be a list")
+    return features
+
+def feature_row(features) -> np.ndarray:
+    """Validate one request's features as a finite float32 row of 90 values."""
+    try:
+        # Values beyond float32 range become inf and are rejected below
+        with np.errstate(over='ignore'):
+            row = np.asarray(features, dtype=np.float32)
+    except (TypeError, ValueError):
+        raise ValueError("Features must be a flat list of 90 numbers")
+    if row.ndim != 1:
+        raise ValueError(f"Features must be a flat list of 90 numbers, got shape {row.shape}")
+    if row.shape[0] != 90:
+        raise ValueError(f"Expected 90 features, got {row.shape[0]}")
+    if not np.isfinite(row).all():
+        raise ValueError("Features must be finite numbers")
+    return row
+
+# ============================================================================
+# LONG-LIVED SERVER MODE
+# ============================================================================
+
+_started_at = time.monotonic()
+_requests_served = 0
+
+def health() -> dict:
+    """Readiness probe payload for long-lived modes."""
+    return {
+        "status": "ok" if _model is not None else "loading",
+        "ready": _model is not None,
+        "model": model_file_path(),
+        "backend": _backend,
+        "pid": os.getpid(),
+        "uptime": round(time.monotonic() - _started_at, 3),
+        "requests": _requests_served,
+        "cache": _cache.stats() if _cache is not None else None,
+        "scheduler": _scheduler.stats() if _scheduler is not None else None
+    }
+
+def handle_request(line: str) -> dict:
+    """Answer a single JSON-line request. Never raises."""
+    global _requests_served
+    try:
+        with metrics.stage('validate'):
+            input_data = json.loads(line)
+            op = input_data.get('op') if isinstance(input_data, dict) else None
+            if op is None:
+                # Validate per request so one bad row can't fail a whole batch
+                row = feature_row(parse_features(input_data))
+        if op == 'health':
+            return health()
+        if op == 'metrics':
+            return {"format": "prometheus", "text": metrics.prometheus()}
+        if op == 'rank':
+            with _predict_lock:
+                return handle_rank(input_data)
+        if op is not None:
+            return {"error": f"Unknown op '{op}'"}
+
+        if _scheduler is None:
+            with _predict_lock:
+                result = format_result(predict(row))
+                _requests_served += 1
+            return result
+
+        result = format_result(to_prediction_list(_scheduler.submit(row).result()))
+        with _predict_lock:
+            _requests_served += 1
+        return result
+    except json.JSONDecodeError as e:
+        return {"error": f"Invalid JSON input: {e}"}
+    except ValueError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"Unexpected error: {e}"}
+
+def dump_metrics_on_signal() -> None:
+    """Write Prometheus text to stderr on SIGUSR1 (long-lived modes)."""
+    import signal
+
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda *_: sys.stderr.write(metrics.prometheus()))
+
+def serve_stdio() -> None:
+    """Answer JSON-line requests on stdin until EOF."""
+    dump_metrics_on_signal()
+    get_model()
+    print(json.dumps(health()), flush=True)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        sys.stdout.write(json.dumps(handle_request(line)) + "\n")
+        sys.stdout.flush()
+
+def serve_socket(socket_path: str, window_ms: float = DEFAULT_WINDOW_MS,
+                 max_batch: int = DEFAULT_MAX_BATCH, workers: int = 0) -> None:
+    """
+    Answer JSON-line requests on a local Unix socket.
+
+    Each connection gets its own thread; concurrent requests are coalesced
+    by a MicroBatcher into one forward pass per window_ms / max_batch.
+    max_batch=1 disables batching. With workers > 0 (numpy backend only),
+    requests are spread over a WorkerPool of processes sharing one copy of
+    the weights instead; SIGTERM drains in-flight requests before exiting.
+    """
+    import signal
+    import socketserver
+    global _scheduler
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode('utf-8', errors='replace')
+                if not line.strip():
+                    continue
+                self.wfile.write((json.dumps(handle_request(line)) + "\n").encode('utf-8'))
+                self.wfile.flush()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    dump_metrics_on_signal()
+    model = get_model()
+    if workers > 0:
+        from predict_pool import WorkerPool
+        _scheduler = WorkerPool(model, workers, cache=_cache)
+    elif max_batch > 1:
+        _scheduler = MicroBatcher(predict_batch, window_ms=window_ms, max_batch=max_batch)
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = Server(socket_path, Handler)
+
+    def stop(*_):
+        # serve_forever() must be stopped from another thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if _scheduler is not None:
+            _scheduler.close()
+            _scheduler = None
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+# ============================================================================
+# BULK MODE
+# ============================================================================
+
+DEFAULT_CHUNK_SIZE = 1024
+
+def _write_chunk(out, clamped: np.ndarray, errors: dict) -> None:
+    """Write one chunk of results, keeping error rows in their input position."""
+    it = iter(clamped)
+    n_rows = len(clamped) + len(errors)
+    lines = []
+    for i in range(n_rows):
+        if i in errors:
+            lines.append(json.dumps({"error": errors[i]}))
+        else:
+            lines.append(json.dumps(format_result(to_prediction_list(next(it)))))
+    out.write("\n".join(lines) + "\n")
+    out.flush()
+
+def predict_ndjson_stream(lines, out, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Score an NDJSON stream of requests, writing one result line per input line.
+
+    Each input line is {"features": [90 numbers]} or a bare list of 90 numbers.
+    Only chunk_size rows are held in memory at once. Invalid lines produce
+    {"error": ...} in their position so output stays aligned with input.
+
+    Returns:
+        Number of lines processed
+    """
+    total = 0
+    rows = []
+    errors = {}
+    index = 0
+
+    def flush():
+        clamped = predict_batch(rows) if rows else np.empty((0, 4))
+        _write_chunk(out, clamped, errors)
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            with metrics.stage('validate'):
+                input_data = json.loads(line)
+                features = input_data if isinstance(input_data, list) else parse_features(input_data)
+                rows.append(feature_row(features))
+        except json.JSONDecodeError as e:
+            errors[index] = f"Invalid JSON input: {e}"
+        except (ValueError, TypeError) as e:
+            errors[index] = str(e)
+        index += 1
+        total += 1
+        if index >= chunk_size:
+            flush()
+            rows, errors, index = [], {}, 0
+
+    if index:
+        flush()
+    return total
+
+def predict_npy_stream(path: str, out, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Score an N x 90 .npy matrix, memory-mapped and processed chunk by chunk.
+
+    Returns:
+        Number of rows processed
+    """
+    matrix = np.load(path, mmap_mode='r')
+    if matrix.ndim != 2 or matrix.shape[1] != 90:
+        raise ValueError(f"Expected N x 90 matrix, got shape {matrix.shape}")
+    for start in range(0, matrix.shape[0], chunk_size):
+        _write_chunk(out, predict_batch(matrix[start:start + chunk_size]), {})
+    return matrix.shape[0]
+
+def run_bulk(source: str, chunk_size: int) -> None:
+    """Dispatch --batch input ('-' for stdin NDJSON, *.npy, or an NDJSON file)."""
+    get_model()
+    if source == '-':
+        predict_ndjson_stream(sys.stdin, sys.stdout, chunk_size)
+    elif source.endswith('.npy'):
+        predict_npy_stream(source, sys.stdout, chunk_size)
+    else:
+        with open(source) as f:
+            predict_ndjson_stream(f, sys.stdout, chunk_size)
+
+# ============================================================================
+# TOP-K RANKING
+# ============================================================================
+
+# Feature layout from lib/ml/featureExtraction.ts: 50 resume features, then 40 job features
+RESUME_FEATURES = 50
+JOB_FEATURES = 40
+DEFAULT_TOP_K = 10
+RANK_CHUNK_SIZE = 4096
+
+def _top_k_positions(scores: np.ndarray, idx: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k best scores, breaking ties at the cut-off by lower idx.
+
+    np.argpartition alone keeps an arbitrary subset of rows tied with the
+    k-th score (common, since readiness is clamped to 1.0), so it only finds
+    the cut-off; the tied rows are then taken in index order.
+    """
+    # NaN compares false both ways and would break the partition; rank it last
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    cutoff = np.partition(scores, len(scores) - k)[len(scores) - k]
+    above = np.flatnonzero(scores > cutoff)
+    tied = np.flatnonzero(scores == cutoff)
+    tied = tied[np.argsort(idx[tied], kind='stable')][:k - len(above)]
+    return np.concatenate([above, tied])
+
+def rank_jobs(resume_features, job_features, k: int = DEFAULT_TOP_K,
+              chunk_size: int = RANK_CHUNK_SIZE, model=None) -> list:
+    """
+    Score one resume against many jobs and return the top-K by readiness.
+
+    The resume half of the input is written once into a reusable chunk
+    buffer; only the job half changes between chunks. A running top-K is
+    kept with a partial partition, so there is never a full sort of all jobs.
+    The prediction cache is bypassed (hashing every pair costs more than
+    scoring it).
+
+    Args:
+        resume_features: 50 resume-side features
+        job_features: M x 40 job-side features (array-like or memory-mapped .npy)
+        k: Number of jobs to return
+        chunk_size: Rows per forward pass
+
+    Returns:
+        Up to k dicts {"index", "readiness", "matched", "missing", "weeks"},
+        best first; ties keep the lower job index first
+    """
+    resume = np.asarray(resume_features, dtype=np.float32)
+    if resume.shape != (RESUME_FEATURES,):
+        raise ValueError(f"Expected {RESUME_FEATURES} resume features, got shape {resume.shape}")
+    if not np.isfinite(resume).all():
+        raise ValueError("Resume features must be finite numbers")
+    jobs = job_features if isinstance(job_features, np.ndarray) else np.asarray(job_features, dtype=np.float32)
+    if jobs.ndim != 2 or jobs.shape[1] != JOB_FEATURES:
+        raise ValueError(f"Expected M x {JOB_FEATURES} job features, got shape {jobs.shape}")
+    if k < 1:
+        raise ValueError("k must be >= 1")
+
+    n_jobs = jobs.shape[0]
+    buffer = np.empty((min(chunk_size, max(n_jobs, 1)), 90), dtype=np.float32)
+    buffer[:, :RESUME_FEATURES] = resume
+
+    best_idx = np.empty(0, dtype=np.int64)
+    best_rows = np.empty((0, 4), dtype=np.float64)
+    for start in range(0, n_jobs, chunk_size):
+        stop = min(start + chunk_size, n_jobs)
+        inputs = buffer[:stop - start]
+        inputs[:, RESUME_FEATURES:] = jobs[start:stop]
+        # Checked per chunk so a memory-mapped jobsFile is still read only once
+        finite = np.isfinite(inputs[:, RESUME_FEATURES:]).all(axis=1)
+        if not finite.all():
+            raise ValueError(f"Job features must be finite numbers (job {start + int(np.argmin(finite))})")
+        rows = _forward(inputs, model)
+
+        cand_idx = np.concatenate([best_idx, np.arange(start, stop)])
+        cand_rows = np.concatenate([best_rows, rows])
+        if len(cand_idx) > k:
+            keep = _top_k_positions(cand_rows[:, 0], cand_idx, k)
+            cand_idx, cand_rows = cand_idx[keep], cand_rows[keep]
+        best_idx, best_rows = cand_idx, cand_rows
+
+    order = np.lexsort((best_idx, -best_rows[:, 0]))
+    results = []
+    for i in order:
+        result = format_result(to_prediction_list(best_rows[i]))
+        results.append({"index": int(best_idx[i]), **result})
+    return results
+
+def handle_rank(input_data: dict, default_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Answer a ranking request.
+
+    Request: {"resume": [50 numbers], "jobs": [[40 numbers], ...] | "jobsFile": "jobs.npy", "k": 10}
+    Response: {"total": M, "results": [{"index", "readiness", "matched", "missing", "weeks"}, ...]}
+    """
+    if not isinstance(input_data, dict):
+        raise ValueError("Request must be a JSON object")
+    resume = input_data.get('resume')
+    if not isinstance(resume, list):
+        raise ValueError("'resume' must be a list")
+    if input_data.get('jobsFile'):
+        jobs = np.load(input_data['jobsFile'], mmap_mode='r')
+    else:
+        jobs = input_data.get('jobs')
+        if not isinstance(jobs, list):
+            raise ValueError("'jobs' must be a list of lists (or pass 'jobsFile')")
+        jobs = np.asarray(jobs, dtype=np.float32) if jobs else np.empty((0, JOB_FEATURES), dtype=np.float32)
+    k = input_data.get('k', default_k)
+    if not isinstance(k, int):
+        raise ValueError("'k' must be an integer")
+    return {"total": int(jobs.shape[0]), "results": rank_jobs(resume, jobs, k)}
+
+# ============================================================================
+# CLI
+# ============================================================================
 
 def main():
     """Main entry point for inference."""
-    if len(sys.argv) < 2:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Predict readiness for a resume-job feature vector")
+    parser.add_argument("input", nargs="?", help='JSON input: {"features": [90 numbers]}')
+    parser.add_argument("--backend", choices=BACKENDS, default='keras',
+                        help="Inference backend: Keras (.h5) or NumPy (.npz, no TensorFlow import)")
+    parser.add_argument("--serve", action="store_true", help="Answer JSON lines on stdin")
+    parser.add_argument("--socket", help="Answer JSON lines on a Unix socket at this path")
+    parser.add_argument("--batch-window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="--socket: max time to wait for more requests before running a batch")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH,
+                        help="--socket: max requests per batched forward pass (1 disables batching)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="--socket: spread requests over N worker processes sharing the weights "
+                             "(requires --backend numpy)")
+    parser.add_argument("--batch", metavar="SOURCE",
+                        help="Score NDJSON ('-' for stdin) or an N x 90 .npy file, one result line per row")
+    parser.add_argument("--rank", metavar="REQUEST",
+                        help="Rank jobs for one resume from a JSON request file ('-' for stdin)")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K,
+                        help="--rank: number of jobs to return when the request has no 'k'")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Rows per forward pass in --batch mode")
+    parser.add_argument("--cache-size", type=int,
+                        help=f"In-memory LRU entries (default: {DEFAULT_MAX_ENTRIES} in --serve/--socket, 0 otherwise)")
+    parser.add_argument("--cache-dir", help="Persist cached predictions on disk in this directory")
+    parser.add_argument("--cache-dir-max-entries", type=int, default=DEFAULT_DISK_MAX_ENTRIES,
+                        help="Approximate cap on files in --cache-dir; least recently used are removed")
+    parser.add_argument("--cache-decimals", type=int, default=DEFAULT_DECIMALS,
+                        help="Round features to this many decimals when building cache keys")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print cache hit/miss counters to stderr on exit")
+    parser.add_argument("--timings", choices=("json", "stderr"),
+                        help="Report per-stage timings and peak RSS: in the JSON result, or on stderr "
+                             "(long-lived and --batch modes always use stderr, as Prometheus text)")
+    args = parser.parse_args()
+    set_backend(args.backend)
+
+    long_lived = args.serve or bool(args.socket)
+    cache_size = args.cache_size
+    if cache_size is None:
+        cache_size = DEFAULT_MAX_ENTRIES if long_lived else 0
+    cache = configure_cache(cache_size, args.cache_dir, args.cache_decimals, args.cache_dir_max_entries)
+    if args.cache_stats and cache is not None:
+        import atexit
+        atexit.register(lambda: print(json.dumps({"cache": cache.stats()}), file=sys.stderr))
+    if args.timings and (long_lived or args.batch):
+        import atexit
+        atexit.register(lambda: sys.stderr.write(metrics.prometheus()))
+
+    if args.serve:
+        serve_stdio()
+        return
+    if args.socket:
+        if args.max_batch_size < 1:
+            print("Error: --max-batch-size must be >= 1", file=sys.stderr)
+            sys.exit(1)
+        if args.workers > 0 and args.backend != 'numpy':
+            print("Error: --workers requires --backend numpy", file=sys.stderr)
+            sys.exit(1)
+        serve_socket(args.socket, args.batch_window_ms, args.max_batch_size, args.workers)
+        return
+    if args.rank:
+        try:
+            if args.rank == '-':
+                request = json.load(sys.stdin)
+            else:
+                with open(args.rank) as f:
+                    request = json.load(f)
+            print(json.dumps(handle_rank(request, args.top_k)))
+        except json.JSONDecodeError as e:
+            print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
+            sys.exit(1)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    if args.batch:
+        if args.chunk_size < 1:
+            print("Error: --chunk-size must be >= 1", file=sys.stderr)
+            sys.exit(1)
+        try:
+            run_bulk(args.batch, args.chunk_size)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if not args.input:
         print("Usage: predict.py <json_features>", file=sys.stderr)
         print("Expected JSON format: {\"features\": [90 numbers]}", file=sys.stderr)
         sys.exit(1)
-    
+
     try:
         # Parse input features from command line
-        input_data = json.loads(sys.argv[1])
-        features = input_data.get('features', [])
-        
-        if not isinstance(features, list):
-            raise ValueError("'features' must be a list")
-        
+        with metrics.stage('validate'):
+            input_data = json.loads(args.input)
+            features = parse_features(input_data)
+
         # Make prediction
         predictions = predict(features)
-        
+
         # Output as JSON
-        result = {
-            "readiness": predictions[0],
-            "matched": predictions[1],
-            "missing": predictions[2],
-            "weeks": predictions[3]
-        }
+        result = format_result(predictions)
+        if args.timings:
+            metrics.observe('total', (_interpreter_seconds or 0.0) + time.perf_counter() - _module_started)
+            timings = metrics.timings()
+            if args.timings == 'json':
+                result["timings"] = timings
+            else:
+                print(json.dumps({"timings": timings}), file=sys.stderr)
         print(json.dumps(result))
-        
+
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Multi-process inference worker pool for predict.py.
+
+The supervisor loads the exported NumPy model once and copies its weights
+into a single shared-memory block. Each worker process attaches to that
+block as read-only views, so an extra worker costs an interpreter plus
+NumPy, not another copy of the weights (and never a TensorFlow runtime).
+
+Requests are sent to the live worker with the fewest in-flight requests
+over a per-worker pipe. If a worker dies, its in-flight requests are
+retried once on another worker and the slot is restarted. close() stops
+taking new work, waits for in-flight requests to drain, then stops the
+workers and releases the shared block.
+
+Used by `predict.py --socket PATH --backend numpy --workers N`.
+"""
+
+import sys
+import time
+import itertools
+import threading
+import multiprocessing
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Give up on a request after this many worker crashes while it was in flight
+MAX_ATTEMPTS = 2
+# Minimum delay between restarts of one slot, to avoid hot crash loops
+RESTART_BACKOFF_S = 0.5
+
+
+def _worker_main(conn, shm_name: str, layout: dict) -> None:
+    """Worker process: answer (request_id, rows) messages until told to stop."""
+    import signal
+    from numpy_model import NumpyModel
+    from predict import predict_batch
+
+    # The supervisor owns shutdown; don't die mid-request on the terminal's Ctrl-C
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shm, model = NumpyModel.attach_shared(shm_name, layout)
+    try:
+        while True:
+            try:
+                msg = conn.recv()
+            except EOFError:
+                break
+            if msg is None:
+                break
+            request_id, rows = msg
+            try:
+                conn.send((request_id, predict_batch(rows, model=model), None))
+            except Exception as e:
+                conn.send((request_id, None, f"{type(e).__name__}: {e}"))
+    finally:
+        del model
+        shm.close()
+
+
+class _Slot:
+    """One worker process and the requests it currently owns."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.send_lock = threading.Lock()
+        self.in_flight: Dict[int, Tuple[np.ndarray, Future, int]] = {}
+        self.restarts = 0
+        self.last_start = 0.0
+        self.alive = False
+
+
+class WorkerPool:
+    """Spread single-row predictions across worker processes."""
+
+    def __init__(self, model, workers: int, cache=None):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        # forkserver children fork from a clean, preloaded process; fall back to spawn
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        if 'forkserver' in methods:
+            self._ctx.set_forkserver_preload(['numpy', 'numpy_model', 'predict'])
+        self._shm, self._layout = model.to_shared_memory()
+        # Optional PredictionCache, checked here so hits never reach a worker
+        self._cache = cache
+        self._lock = threading.Condition()
+        self._ids = itertools.count()
+        self._draining = False
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+        self._slots = [_Slot(i) for i in range(workers)]
+        for slot in self._slots:
+            self._start(slot)
+
+    def _start(self, slot: _Slot) -> None:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn, self._shm.name, self._layout),
+            name=f"predict-worker-{slot.index}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        slot.process, slot.conn = process, parent_conn
+        slot.last_start = time.monotonic()
+        slot.alive = True
+        threading.Thread(target=self._reader, args=(slot, parent_conn),
+                         name=f"predict-reader-{slot.index}", daemon=True).start()
+
+    def submit(self, row: np.ndarray) -> Future:
+        """Queue one feature row; the future resolves to its clamped output row."""
+        future: Future = Future()
+        with self._lock:
+            if self._draining:
+                raise RuntimeError("Worker pool is shutting down")
+        row = np.asarray(row, dtype=np.float32)
+        if self._cache is not None:
+            key = self._cache.keys_for(row[None, :])[0]
+            cached = self._cache.get(key)
+            if cached is not None:
+                future.set_result(cached)
+                return future
+            future.add_done_callback(
+                lambda f: f.exception() is None and self._cache.put(key, f.result())
+            )
+        self._dispatch(row, future, attempt=1)
+        return future
+
+    def _dispatch(self, row: np.ndarray, future: Future, attempt: int) -> None:
+        with self._lock:
+            live = [slot for slot in self._slots if slot.alive]
+            while not live:
+                # Every worker is restarting; wait for one to come back
+                self._lock.wait(timeout=1.0)
+                live = [slot for slot in self._slots if slot.alive]
+            slot = min(live, key=lambda s: len(s.in_flight))
+            request_id = next(self._ids)
+            slot.in_flight[request_id] = (row, future, attempt)
+        try:
+            with slot.send_lock:
+                slot.conn.send((request_id, row[None, :]))
+        except (OSError, ValueError):
+            # Pipe already broken; the reader thread will requeue it on EOF
+            pass
+
+    def _reader(self, slot: _Slot, conn) -> None:
+        while True:
+            try:
+                request_id, result, error = conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                entry = slot.in_flight.pop(request_id, None)
+                if error is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+                self._lock.notify_all()
+            if entry is None:
+                continue
+            if error is None:
+                entry[1].set_result(result[0])
+            else:
+                entry[1].set_exception(RuntimeError(error))
+        self._on_worker_exit(slot, conn)
+
+    def _on_worker_exit(self, slot: _Slot, conn) -> None:
+        with self._lock:
+            if slot.conn is not conn:
+                return
+            slot.alive = False
+            orphans = list(slot.in_flight.values())
+            slot.in_flight.clear()
+            draining = self._draining
+            self._lock.notify_all()
+        conn.close()
+        slot.process.join(timeout=1.0)
+
+        if not draining:
+            print(f"predict worker {slot.index} exited with {slot.process.exitcode}; restarting",
+                  file=sys.stderr)
+            wait = RESTART_BACKOFF_S - (time.monotonic() - slot.last_start)
+            if wait > 0:
+                time.sleep(wait)
+            slot.restarts += 1
+            self._start(slot)
+
+        for row, future, attempt in orphans:
+            if attempt < MAX_ATTEMPTS and not draining:
+                with self._lock:
+                    self.retried += 1
+                self._dispatch(row, future, attempt + 1)
+            else:
+                with self._lock:
+                    self.failed += 1
+                future.set_exception(RuntimeError("Prediction worker crashed"))
+
+    def stats(self) -> dict:
+        """Worker and request counters for the health probe."""
+        with self._lock:
+            return {
+                "workers": len(self._slots),
+                "alive": sum(slot.alive for slot in self._slots),
+                "pids": [slot.process.pid for slot in self._slots],
+                "inFlight": sum(len(slot.in_flight) for slot in self._slots),
+                "restarts": sum(slot.restarts for slot in self._slots),
+                "completed": self.completed,
+                "retried": self.retried,
+                "failed": self.failed,
+                "sharedWeightBytes": self._shm.size
+            }
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Stop taking work, drain in-flight requests, then stop workers."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._draining = True
+            while any(slot.in_flight for slot in self._slots):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._lock.wait(timeout=remaining)
+            slots: List[_Slot] = list(self._slots)
+        for slot in slots:
+            try:
+                with slot.send_lock:
+                    slot.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for slot in slots:
+            slot.process.join(timeout=5.0)
+            if slot.process.is_alive():
+                slot.process.terminate()
+                slot.process.join()
+        self._shm.close()
+        self._shm.unlink()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Prediction cache for predict.py.
+
+Keys are a hash of the model file's content hash plus the feature vector
+rounded to a fixed number of decimals, so re-running the same analysis is a
+lookup and retraining the model invalidates every entry automatically.
+
+Two tiers:
+- an in-memory LRU bounded by entry count (long-lived server modes)
+- an optional on-disk store, one small JSON file per key (one-shot CLI runs)
+
+The disk store is capped at about disk_max_entries files. Files are spread
+over 256 shard directories by key prefix; a write that pushes its shard past
+its share of the cap removes that shard's least recently used files (by
+mtime, refreshed on every disk hit). A write only ever lists its own shard,
+so one-shot runs never walk the whole store.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_DECIMALS = 6
+DEFAULT_DISK_MAX_ENTRIES = 1_000_000
+# Keys are hex, so key[:2] spreads files over this many shard directories
+DISK_SHARDS = 256
+# A full shard is trimmed to this fraction of its share
+DISK_EVICT_TO = 0.9
+
+
+class PredictionCache:
+    """LRU cache of clamped [readiness, matched, missing, weeks] rows."""
+
+    def __init__(self, model_hash: str, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 disk_dir: Optional[str] = None, decimals: int = DEFAULT_DECIMALS,
+                 disk_max_entries: int = DEFAULT_DISK_MAX_ENTRIES):
+        self.model_hash = model_hash.encode('ascii')
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_max_entries = disk_max_entries
+        self.decimals = decimals
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def keys_for(self, features_array: np.ndarray) -> List[str]:
+        """Stable cache keys for each row of an N x 90 matrix."""
+        # Adding 0.0 turns -0.0 into 0.0 so both round to the same bytes
+        quantized = np.round(np.asarray(features_array, dtype=np.float64), self.decimals) + 0.0
+        quantized = np.ascontiguousarray(quantized)
+        keys = []
+        for row in quantized:
+            digest = hashlib.blake2b(self.model_hash, digest_size=16)
+            digest.update(row.tobytes())
+            keys.append(digest.hexdigest())
+        return keys
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached row for key, or None. Counts a hit or a miss."""
+        with self._lock:
+            row = self._entries.get(key)
+            if row is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return row
+
+        row = self._read_disk(key)
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, row)
+        return row
+
+    def put(self, key: str, row: np.ndarray) -> None:
+        """Insert a clamped prediction row."""
+        row = np.array(row, dtype=np.float64)
+        with self._lock:
+            self._store(key, row)
+        self._write_disk(key, row)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "diskHits": self.disk_hits,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "evictions": self.evictions,
+                "diskEvictions": self.disk_evictions
+            }
+
+    def _store(self, key: str, row: np.ndarray) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = row
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[np.ndarray]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path) as f:
+                values = json.load(f)
+            if isinstance(values, list) and len(values) == 4:
+                os.utime(path)
+                return np.array(values, dtype=np.float64)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_disk(self, key: str, row: np.ndarray) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(row.tolist(), f)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError:
+            return  # The disk tier is best-effort
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        self._evict_shard(os.path.dirname(path))
+
+    def _evict_shard(self, shard_dir: str) -> None:
+        """Trim one shard directory to its share of disk_max_entries, oldest first."""
+        limit = max(1, self.disk_max_entries // DISK_SHARDS)
+        try:
+            names = [n for n in os.listdir(shard_dir) if n.endswith('.json')]
+        except OSError:
+            return
+        if len(names) <= limit:
+            return
+        entries = []
+        for name in names:
+            full = os.path.join(shard_dir, name)
+            try:
+                entries.append((os.stat(full).st_mtime, full))
+            except OSError:
+                continue
+        entries.sort()
+        for _, full in entries[:len(entries) - int(limit * DISK_EVICT_TO)]:
+            try:
+                os.unlink(full)
+            except OSError:
+                continue
+            with self._lock:
+                self.disk_evictions += 1
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Record / replay of career-site responses for offline company_scraper.py runs.
+
+Record mode runs a normal scrape with a recorder installed in
+company_scraper.http_get, so every page body the scraper receives is saved
+to a corpus directory together with the company config:
+
+    corpus/index.json           {"configs": [...], "pages": {url: {file, contentType, etag, lastModified}}}
+    corpus/pages/<sha256>.html  one body per URL
+
+Replay mode serves a corpus from a local threaded HTTP server. The scraper
+is pointed at it with company_scraper.set_replay_base(), which puts the
+original URL in the request path, so listing links and next-page URLs
+resolve exactly as they did live. Latency (fixed + uniform jitter) and
+errors (HTTP 503 or a dropped connection) can be injected to exercise the
+retry and concurrency paths. URLs missing from the corpus get a 404.
+Recorded ETag / Last-Modified validators are served back, and a request
+whose If-None-Match or If-Modified-Since matches them gets a 304, so the
+conditional-GET path of company_scraper.py --http-cache-dir can be replayed.
+
+CLI:
+    python3 scripts/scrape_replay.py record --company Google --corpus corpus/ [--max-pages 2]
+    python3 scripts/scrape_replay.py serve --corpus corpus/ [--port 8800]
+        [--latency-ms 50] [--jitter-ms 25] [--error-rate 0.02] [--drop-rate 0.01]
+
+See benchmark_scraper.py for timing a replayed crawl.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from urllib.parse import unquote
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+
+INDEX_FILE = "index.json"
+
+
+def _page_file(url: str) -> str:
+    return os.path.join("pages", hashlib.sha256(url.encode('utf-8')).hexdigest() + ".html")
+
+
+def not_modified(entry: Dict, headers) -> bool:
+    """
+    Whether a conditional request's validators match a recorded page.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2);
+    ETags are compared weakly, as for GET.
+    """
+    if_none_match = headers.get("If-None-Match")
+    if if_none_match is not None:
+        etag = entry.get("etag")
+        if not etag:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+    if_modified_since = headers.get("If-Modified-Since")
+    if if_modified_since and entry.get("lastModified"):
+        try:
+            return parsedate_to_datetime(entry["lastModified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class Corpus:
+    """A directory of recorded page bodies keyed by URL, plus the configs that produced them."""
+
+    def __init__(self, corpus_dir: str):
+        self.corpus_dir = corpus_dir
+        self.configs: List[Dict] = []
+        self.pages: Dict[str, Dict] = {}
+        try:
+            with open(os.path.join(corpus_dir, INDEX_FILE), encoding='utf-8') as f:
+                index = json.load(f)
+            self.configs = index.get("configs", [])
+            self.pages = index.get("pages", {})
+        except FileNotFoundError:
+            pass
+
+    def body(self, url: str) -> Optional[bytes]:
+        entry = self.pages.get(url)
+        if entry is None:
+            return None
+        try:
+            with open(os.path.join(self.corpus_dir, entry["file"]), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def save(self) -> None:
+        os.makedirs(self.corpus_dir, exist_ok=True)
+        # Write then rename so an interrupted recording keeps the previous index
+        fd, tmp_path = tempfile.mkstemp(dir=self.corpus_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"configs": self.configs, "pages": self.pages}, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.corpus_dir, INDEX_FILE))
+
+
+class CorpusRecorder:
+    """company_scraper.set_recorder() target; thread-safe, bodies are written as they arrive."""
+
+    def __init__(self, corpus: Corpus):
+        self.corpus = corpus
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(corpus.corpus_dir, "pages"), exist_ok=True)
+
+    def record(self, url: str, resp) -> None:
+        rel_path = _page_file(url)
+        with open(os.path.join(self.corpus.corpus_dir, rel_path), 'wb') as f:
+            f.write(resp.content)
+        with self._lock:
+            self.corpus.pages[url] = {
+                "file": rel_path,
+                "contentType": resp.headers.get("Content-Type", "text/html; charset=utf-8"),
+                "etag": resp.headers.get("ETag"),
+                "lastModified": resp.headers.get("Last-Modified")
+            }
+
+    def add_config(self, config: Dict) -> None:
+        with self._lock:
+            self.corpus.configs = [c for c in self.corpus.configs if c.get("name") != config.get("name")]
+            self.corpus.configs.append(config)
+
+
+class ReplayServer:
+    """Threaded local HTTP stand-in serving a corpus with injected latency and errors."""
+
+    def __init__(self, corpus: Corpus, port: int = 0, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, drop_rate: float = 0.0, seed: Optional[int] = None):
+        self.corpus = corpus
+        self.latency_s = latency_ms / 1000.0
+        self.jitter_s = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.drops = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def _draw(self) -> tuple:
+        with self._lock:
+            self.requests += 1
+            return self._rng.random(), self._rng.random(), self._rng.uniform(0, self.jitter_s)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one write; unbuffered writes stall on delayed ACKs
+            wbufsize = -1
+
+            def do_GET(self):
+                error_roll, drop_roll, jitter = server._draw()
+                time.sleep(server.latency_s + jitter)
+                if drop_roll < server.drop_rate:
+                    server._count("drops")
+                    self.close_connection = True
+                    return  # no response at all: the client sees a connection error
+                if error_roll < server.error_rate:
+                    server._count("errors")
+                    self._send(503, b"injected error", "text/plain")
+                    return
+                url = unquote(self.path[1:])
+                body = server.corpus.body(url)
+                if body is None:
+                    server._count("misses")
+                    self._send(404, b"not in corpus", "text/plain")
+                    return
+                entry = server.corpus.pages[url]
+                extra = {k: entry[key] for k, key in (("ETag", "etag"), ("Last-Modified", "lastModified"))
+                         if entry.get(key)}
+                if not_modified(entry, self.headers):
+                    server._count("not_modified")
+                    self.send_response(304)
+                    for k, v in extra.items():
+                        self.send_header(k, v)
+                    self.end_headers()
+                    return
+                self._send(200, body, entry.get("contentType") or "text/html", extra)
+
+            def _send(self, status: int, body: bytes, content_type: str, extra: Optional[Dict] = None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in (extra or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted (the `serve` CLI)."""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "injectedErrors": self.errors,
+                "droppedConnections": self.drops, "notInCorpus": self.misses,
+                "notModified": self.not_modified}
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def record(config: Dict, corpus_dir: str, max_pages: int = 2, **scrape_options) -> List[Dict]:
+    """Scrape one company live, saving every fetched page and the config to the corpus."""
+    import company_scraper
+
+    corpus = Corpus(corpus_dir)
+    recorder = CorpusRecorder(corpus)
+    recorder.add_config(config)
+    company_scraper.set_recorder(recorder)
+    try:
+        return company_scraper.scrape_company(config, max_pages=max_pages, **scrape_options)
+    finally:
+        company_scraper.set_recorder(None)
+        corpus.save()
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Record or replay career-site responses")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    rec = sub.add_parser("record", help="Scrape live and save every page to a corpus")
+    rec.add_argument("--company", help="Company name in lib/scrapers/companies.json")
+    rec.add_argument("--config", help="Path to company config JSON")
+    rec.add_argument("--corpus", required=True, help="Corpus directory (created or extended)")
+    rec.add_argument("--max-pages", type=int, default=2, help="Max listing pages")
+
+    srv = sub.add_parser("serve", help="Serve a corpus on localhost")
+    srv.add_argument("--corpus", required=True, help="Corpus directory")
+    srv.add_argument("--port", type=int, default=8800)
+    srv.add_argument("--latency-ms", type=float, default=0.0, help="Fixed delay per response")
+    srv.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform random delay per response")
+    srv.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    srv.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of connections closed unanswered")
+    srv.add_argument("--seed", type=int, help="Seed for injected latency and errors")
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        config = None
+        if args.config:
+            with open(args.config) as f:
+                config = json.load(f)
+        elif args.company:
+            with open("lib/scrapers/companies.json") as f:
+                matches = [c for c in json.load(f) if c.get("name", "").lower() == args.company.lower()]
+            config = matches[0] if matches else None
+        if not config:
+            print("Error: provide --company or --config", file=sys.stderr)
+            sys.exit(1)
+        jobs = record(config, args.corpus, max_pages=args.max_pages)
+        print(f"Recorded {config.get('name')}: {len(jobs)} jobs to {args.corpus}", file=sys.stderr)
+        return
+
+    corpus = Corpus(args.corpus)
+    if not corpus.pages:
+        print(f"Error: no recorded pages in {args.corpus}", file=sys.stderr)
+        sys.exit(1)
+    server = ReplayServer(corpus, args.port, args.latency_ms, args.jitter_ms, args.error_rate,
+                          args.drop_rate, args.seed)
+    print(f"Replaying {len(corpus.pages)} pages at {server.base_url} "
+          f"(set_replay_base or prefix URLs with {server.base_url}/<quoted url>)", file=sys.stderr)
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
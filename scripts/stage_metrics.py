@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Stage-level latency and memory instrumentation for predict.py.
+
+Every stage of the prediction path (interpreter startup, imports, model
+load, validation, cache lookup, forward pass) is timed with a monotonic
+clock and accumulated as count / total / max. Peak RSS is sampled after
+startup stages. The same numbers are exposed as a compact `timings` object
+for one-shot runs and as Prometheus text for long-lived modes.
+"""
+
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Process memory high-water mark in KiB, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def interpreter_startup_seconds() -> Optional[float]:
+    """
+    Seconds between process creation and now, from /proc (Linux only).
+
+    Called at the top of the script, this is the interpreter's own startup
+    cost before any of our code ran.
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            # comm (field 2) may contain spaces; fields after it are fixed
+            fields = f.read().rsplit(')', 1)[1].split()
+        start_ticks = int(fields[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StageMetrics:
+    """Thread-safe per-stage latency accumulator."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, List[float]] = {}  # name -> [count, total, max]
+        self._memory: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one observation of `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def mark_memory(self, label: str) -> None:
+        """Record the peak RSS as of this point under `label`."""
+        peak = peak_rss_kb()
+        if peak is not None:
+            with self._lock:
+                self._memory[label] = peak
+
+    def timings(self) -> dict:
+        """Compact {stage: total ms} plus memory marks, for one-shot output."""
+        self.mark_memory('peak')
+        with self._lock:
+            stages = {name: round(entry[1] * 1000.0, 3) for name, entry in self._stages.items()}
+            return {"stagesMs": stages, "maxRssKb": dict(self._memory)}
+
+    def prometheus(self, prefix: str = 'hireable_predict') -> str:
+        """Prometheus text exposition of all stages and memory marks."""
+        self.mark_memory('peak')
+        with self._lock:
+            stages = {name: list(entry) for name, entry in self._stages.items()}
+            memory = dict(self._memory)
+
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent in each prediction stage.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for name, (count, total, _) in sorted(stages.items()):
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {total:.9f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {int(count)}')
+        lines += [
+            f"# HELP {prefix}_stage_max_seconds Slowest single observation per stage.",
+            f"# TYPE {prefix}_stage_max_seconds gauge",
+        ]
+        for name, (_, _, longest) in sorted(stages.items()):
+            lines.append(f'{prefix}_stage_max_seconds{{stage="{name}"}} {longest:.9f}')
+        lines += [
+            f"# HELP {prefix}_max_rss_bytes Peak resident set size after each startup stage.",
+            f"# TYPE {prefix}_max_rss_bytes gauge",
+        ]
+        for label, kb in sorted(memory.items()):
+            lines.append(f'{prefix}_max_rss_bytes{{after="{label}"}} {kb * 1024}')
+        return "\n".join(lines) + "\n"